@@ -10,6 +10,7 @@ from src.better_budget_tracker.budget import BudgetManager, IncomeEntry, Expense
 from src.better_budget_tracker.goal_tracker import GoalTracker, SavingsGoal
 from reports import ReportGenerator
 from datetime import date
+import sys
 
 
 def create_sample_data():
@@ -174,119 +175,114 @@ def create_sample_data():
         )
     ]
     
-    print("Adding sample data...")
+    lines = []
+    out = lines.append
+    out("Adding sample data...")
     
-    # Add income entries
-    for income in sample_income:
-        try:
-            income_id = budget_manager.add_income(income)
-            print(f"✅ Added income: {income.source} - ${income.amount:,.2f} (ID: {income_id})")
-        except Exception as e:
-            print(f"❌ Failed to add income {income.source}: {e}")
-    
-    # Add expense entries
-    for expense in sample_expenses:
-        try:
-            expense_id = budget_manager.add_expense(expense)
-            print(f"✅ Added expense: {expense.category} - ${expense.amount:,.2f} (ID: {expense_id})")
-        except Exception as e:
-            print(f"❌ Failed to add expense {expense.category}: {e}")
-    
-    # Add budget limits
-    for budget in sample_budgets:
-        try:
-            budget_id = budget_manager.set_budget_limit(budget)
-            print(f"✅ Set budget limit: {budget.category} - ${budget.monthly_limit:,.2f} (ID: {budget_id})")
-        except Exception as e:
-            print(f"❌ Failed to set budget limit {budget.category}: {e}")
+    # Add income, expenses and budget limits (one transaction for all of them)
+    try:
+        added_income, added_expenses, added_limits = budget_manager.bulk_load(
+            sample_income, sample_expenses, sample_budgets
+        )
+        out(f"✅ Added {added_income} income entries")
+        out(f"✅ Added {added_expenses} expense entries")
+        out(f"✅ Set {added_limits} budget limits")
+    except Exception as e:
+        out(f"❌ Failed to add budget data: {e}")
+
+    # Add savings goals (one transaction for the whole batch)
+    try:
+        added = goal_tracker.add_goals_bulk(sample_goals)
+        out(f"✅ Added {added} goals")
+    except Exception as e:
+        out(f"❌ Failed to add goals: {e}")
     
-    # Add savings goals
-    for goal in sample_goals:
-        try:
-            goal_id = goal_tracker.add_goal(goal)
-            print(f"✅ Added goal: {goal.name} - ${goal.target_amount:,.2f} (ID: {goal_id})")
-        except Exception as e:
-            print(f"❌ Failed to add goal {goal.name}: {e}")
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return budget_manager, goal_tracker
 
 
 def demonstrate_features(budget_manager, goal_tracker):
     """Demonstrate various features of the budget tracker."""
-    print("\n" + "="*60)
-    print("BUDGET TRACKER DEMONSTRATION")
-    print("="*60)
+    # Collect the output and write it in one go rather than one print per line
+    lines = []
+    out = lines.append
+    out("\n" + "="*60)
+    out("BUDGET TRACKER DEMONSTRATION")
+    out("="*60)
     
     # Monthly summary
     current_date = date.today()
     monthly_summary = budget_manager.get_monthly_summary(current_date.year, current_date.month)
     
-    print(f"\n1. MONTHLY FINANCIAL SUMMARY:")
-    print("-" * 35)
-    print(f"Total Income: ${monthly_summary['total_income']:,.2f}")
-    print(f"Total Expenses: ${monthly_summary['total_expenses']:,.2f}")
-    print(f"Net Income: ${monthly_summary['net_income']:,.2f}")
-    print(f"Savings Rate: {monthly_summary['savings_rate']:.1f}%")
+    out(f"\n1. MONTHLY FINANCIAL SUMMARY:")
+    out("-" * 35)
+    out(f"Total Income: ${monthly_summary['total_income']:,.2f}")
+    out(f"Total Expenses: ${monthly_summary['total_expenses']:,.2f}")
+    out(f"Net Income: ${monthly_summary['net_income']:,.2f}")
+    out(f"Savings Rate: {monthly_summary['savings_rate']:.1f}%")
     
     # Budget status
-    print(f"\n2. BUDGET STATUS:")
-    print("-" * 20)
+    out(f"\n2. BUDGET STATUS:")
+    out("-" * 20)
     budget_status = budget_manager.get_budget_status(current_date.year, current_date.month)
-    for category, status in budget_status.items():
-        status_icon = "🔴" if status['is_over_budget'] else "🟢"
-        print(f"{status_icon} {category}: ${status['spent']:,.2f} / ${status['limit']:,.2f} "
-              f"({status['percentage_used']:.1f}%)")
+    for status in budget_status:
+        status_icon = "🔴" if status.is_over_budget else "🟢"
+        out(f"{status_icon} {status.category}: ${status.spent:,.2f} / ${status.limit:,.2f} "
+            f"({status.percentage_used:.1f}%)")
     
     # Overspending alerts
     overspending_alerts = budget_manager.get_overspending_alerts(current_date.year, current_date.month)
     if overspending_alerts:
-        print(f"\n3. OVERSPENDING ALERTS:")
-        print("-" * 25)
+        out(f"\n3. OVERSPENDING ALERTS:")
+        out("-" * 25)
         for alert in overspending_alerts:
-            print(f"⚠️  {alert['category']}: Over by ${alert['overspent']:,.2f} "
-                  f"({alert['percentage_over']:.1f}% over limit)")
+            out(f"⚠️  {alert['category']}: Over by ${alert['overspent']:,.2f} "
+                f"({alert['percentage_over']:.1f}% over limit)")
     
     # Category breakdown
-    print(f"\n4. EXPENSE BREAKDOWN BY CATEGORY:")
-    print("-" * 40)
-    category_summary = budget_manager.get_category_summary(current_date.year, current_date.month)
-    total_expenses = sum(category_summary.values())
-    for category, amount in sorted(category_summary.items(), key=lambda x: x[1], reverse=True):
+    out(f"\n4. EXPENSE BREAKDOWN BY CATEGORY:")
+    out("-" * 40)
+    category_summary, total_expenses = budget_manager.get_category_breakdown(current_date.year, current_date.month)
+    for category, amount in category_summary.items():
         percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
-        print(f"{category}: ${amount:,.2f} ({percentage:.1f}%)")
+        out(f"{category}: ${amount:,.2f} ({percentage:.1f}%)")
     
     # Goals summary
-    print(f"\n5. SAVINGS GOALS SUMMARY:")
-    print("-" * 30)
-    goals_summary = goal_tracker.get_goals_summary()
-    print(f"Total Goals: {goals_summary['total_goals']}")
-    print(f"Active Goals: {goals_summary['active_goals']}")
-    print(f"Completed Goals: {goals_summary['completed_goals']}")
-    print(f"Overdue Goals: {goals_summary['overdue_goals']}")
-    print(f"Total Target Amount: ${goals_summary['total_target_amount']:,.2f}")
-    print(f"Total Current Amount: ${goals_summary['total_current_amount']:,.2f}")
-    print(f"Total Remaining: ${goals_summary['total_remaining']:,.2f}")
-    print(f"Overall Progress: {goals_summary['overall_progress']:.1f}%")
+    out(f"\n5. SAVINGS GOALS SUMMARY:")
+    out("-" * 30)
+    all_goals = goal_tracker.get_all_goals()
+    goals_summary = goal_tracker.get_goals_summary(all_goals)
+    out(f"Total Goals: {goals_summary['total_goals']}")
+    out(f"Active Goals: {goals_summary['active_goals']}")
+    out(f"Completed Goals: {goals_summary['completed_goals']}")
+    out(f"Overdue Goals: {goals_summary['overdue_goals']}")
+    out(f"Total Target Amount: ${goals_summary['total_target_amount']:,.2f}")
+    out(f"Total Current Amount: ${goals_summary['total_current_amount']:,.2f}")
+    out(f"Total Remaining: ${goals_summary['total_remaining']:,.2f}")
+    out(f"Overall Progress: {goals_summary['overall_progress']:.1f}%")
     
     # Active goals details
-    active_goals = goal_tracker.get_active_goals()
+    active_goals = goal_tracker.get_active_goals(all_goals)
     if active_goals:
-        print(f"\n6. ACTIVE GOALS DETAILS:")
-        print("-" * 30)
+        out(f"\n6. ACTIVE GOALS DETAILS:")
+        out("-" * 30)
         for goal in active_goals:
-            status_icon = "🔴" if goal.is_overdue else "🟡"
-            print(f"{status_icon} {goal.name} ({goal.category})")
-            print(f"   Progress: ${goal.current_amount:,.2f} / ${goal.target_amount:,.2f} "
-                  f"({goal.progress_percentage:.1f}%)")
-            print(f"   Target Date: {goal.target_date} ({goal.days_remaining} days remaining)")
+            status_icon = "🔴" if goal.is_overdue_on(current_date) else "🟡"
+            out(f"{status_icon} {goal.name} ({goal.category})")
+            out(f"   Progress: ${goal.current_amount:,.2f} / ${goal.target_amount:,.2f} "
+                f"({goal.progress_percentage:.1f}%)")
+            out(f"   Target Date: {goal.target_date} ({goal.days_remaining_on(current_date)} days remaining)")
     
     # Completed goals
-    completed_goals = goal_tracker.get_completed_goals()
+    completed_goals = goal_tracker.get_completed_goals(all_goals)
     if completed_goals:
-        print(f"\n7. COMPLETED GOALS:")
-        print("-" * 20)
+        out(f"\n7. COMPLETED GOALS:")
+        out("-" * 20)
         for goal in completed_goals:
-            print(f"✅ {goal.name} ({goal.category}) - ${goal.target_amount:,.2f}")
+            out(f"✅ {goal.name} ({goal.category}) - ${goal.target_amount:,.2f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def generate_sample_reports(budget_manager, goal_tracker):
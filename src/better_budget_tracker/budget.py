@@ -7,17 +7,225 @@ income/expense tracking, budget limits, and financial calculations.
 
 import sqlite3
 import os
+import logging
+import threading
+from sys import intern
 from datetime import datetime, date
-from html.parser import incomplete
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, NamedTuple, Optional, Tuple, Union
 from dataclasses import dataclass
+from functools import lru_cache
 
-from tldextract.suffix_list import extract_tlds_from_suffix_list
+import numpy as np
 
 from better_budget_tracker.utils import validate_amount, validate_date, format_currency, get_current_date_string
 
+logger = logging.getLogger(__name__)
+
+# Range filters compare date_int, a virtual column holding the entry date as days
+# since 1970-01-01, so SQLite compares (and indexes) integers instead of text.
+_DATE_INT_EXPR = "CAST(julianday(date) - 2440587.5 AS INTEGER)"
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# SQL for the hot insert/select paths. Keeping each statement in one constant means
+# every call hands sqlite3 the same string, so its prepared statement is reused
+# from the connection's statement cache instead of being re-parsed.
+#
+# Listings are ordered by date only, which SQLite satisfies by walking the date
+# index instead of sorting. Entries on the same date come back in id order, since
+# index entries with equal keys are ordered by rowid.
+#
+# Reads name their columns in from_row_unchecked order rather than using SELECT *,
+# and map empty descriptions to '' and empty aliases to NULL in SQL, so decoding a
+# row is plain positional assignment.
+_INCOME_COLUMNS = "id, date, source, amount, COALESCE(description, ''), NULLIF(alias, '')"
+_EXPENSE_COLUMNS = "id, date, category, amount, COALESCE(description, ''), NULLIF(alias, '')"
+_ALIAS_COLUMNS = "id, alias, full_name, type"
+_BUDGET_LIMIT_COLUMNS = "id, category, monthly_limit, COALESCE(description, '')"
+_SQL_ADD_INCOME = """
+    INSERT INTO income (date, source, amount, description, alias)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_ALL_INCOME = f"SELECT {_INCOME_COLUMNS} FROM income ORDER BY date ASC"
+# Deletes hand back the deleted row. The rows are always fetched to the end, which
+# finishes the statement and its implicit transaction.
+_SQL_DELETE_INCOME = f"DELETE FROM income WHERE id = ? RETURNING {_INCOME_COLUMNS}"
+# Date-range reads (get_*_by_date_range and get_*_arrays) take an inclusive end
+# date, unlike the half-open monthly aggregates below.
+_SQL_INCOME_BY_DATE_RANGE = f"""
+    SELECT {_INCOME_COLUMNS} FROM income
+    WHERE date_int >= ? AND date_int <= ?
+    ORDER BY date_int ASC
+"""
+_SQL_INCOME_ARRAYS = """
+    SELECT date_int, amount, source FROM income
+    WHERE date_int >= ? AND date_int <= ?
+    ORDER BY date_int ASC
+"""
+_SQL_ADD_EXPENSE = """
+    INSERT INTO expenses (date, category, amount, description, alias)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_ALL_EXPENSES = f"SELECT {_EXPENSE_COLUMNS} FROM expenses ORDER BY date ASC"
+_SQL_DELETE_EXPENSE = f"DELETE FROM expenses WHERE id = ? RETURNING {_EXPENSE_COLUMNS}"
+_SQL_EXPENSES_BY_CATEGORY = f"SELECT {_EXPENSE_COLUMNS} FROM expenses WHERE category = ? ORDER BY date ASC"
+_SQL_EXPENSES_BY_DATE_RANGE = f"""
+    SELECT {_EXPENSE_COLUMNS} FROM expenses
+    WHERE date_int >= ? AND date_int <= ?
+    ORDER BY date_int ASC
+"""
+_SQL_EXPENSE_ARRAYS = """
+    SELECT date_int, amount, category FROM expenses
+    WHERE date_int >= ? AND date_int <= ?
+    ORDER BY date_int ASC
+"""
+# Row layout of the *_ARRAYS queries, read straight into a record array
+_ARRAY_ROW_DTYPE = np.dtype([('date_int', np.int64), ('amount', np.float64), ('label', object)])
+_SQL_ADD_ALIAS = """
+    INSERT INTO aliases (alias, full_name, type)
+    VALUES (?, ?, ?)
+"""
+_SQL_ALIAS = f"SELECT {_ALIAS_COLUMNS} FROM aliases WHERE alias = ? AND type = ?"
+_SQL_ALL_ALIASES = f"SELECT {_ALIAS_COLUMNS} FROM aliases"
+_SQL_ALIASES_BY_TYPE = f"SELECT {_ALIAS_COLUMNS} FROM aliases WHERE type = ?"
+_SQL_DELETE_ALIAS = f"DELETE FROM aliases WHERE alias = ? AND type = ? RETURNING {_ALIAS_COLUMNS}"
+_SQL_RENAME_ALIAS = "UPDATE aliases SET alias = ?, full_name = ? WHERE alias = ? AND type = ?"
+_SQL_RENAME_INCOME_ALIAS = "UPDATE income SET alias = ?, source = ? WHERE alias = ?"
+_SQL_RENAME_EXPENSE_ALIAS = "UPDATE expenses SET alias = ?, category = ? WHERE alias = ?"
+_SQL_SET_BUDGET_LIMIT = """
+    INSERT OR REPLACE INTO budget_limits (category, monthly_limit, description)
+    VALUES (?, ?, ?)
+"""
+_SQL_ALL_BUDGET_LIMITS = f"SELECT {_BUDGET_LIMIT_COLUMNS} FROM budget_limits ORDER BY category"
+_SQL_BUDGET_LIMIT = f"SELECT {_BUDGET_LIMIT_COLUMNS} FROM budget_limits WHERE category = ?"
+_SQL_DELETE_BUDGET_LIMIT = "DELETE FROM budget_limits WHERE category = ?"
+
+# Re-indexing. Table names are interpolated into its SQL, so only these tables are accepted.
+_REINDEXABLE_TABLES = frozenset({"income", "expenses", "aliases", "budget_limits"})
+_SQL_TABLE_SCHEMA = "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?"
+_SQL_RESET_SEQUENCE = "DELETE FROM sqlite_sequence WHERE name = ?"
+
+# Monthly aggregates. Ranges are half-open (start inclusive, end exclusive) so the
+# first day of the following month is not counted.
+_SQL_TOTAL_INCOME = "SELECT COALESCE(SUM(amount), 0) FROM income WHERE date_int >= ? AND date_int < ?"
+_SQL_TOTAL_EXPENSES = "SELECT COALESCE(SUM(amount), 0) FROM expenses WHERE date_int >= ? AND date_int < ?"
+_SQL_CATEGORY_TOTAL = """
+    SELECT COALESCE(SUM(amount), 0) FROM expenses
+    WHERE category = ? AND date_int >= ? AND date_int < ?
+"""
+_SQL_CATEGORY_SUMMARY = """
+    SELECT category, SUM(amount) FROM expenses
+    WHERE date_int >= ? AND date_int < ?
+    GROUP BY category
+"""
+# The window total is computed over the grouped rows, so every row carries the
+# month's total spending alongside its category's share.
+_SQL_CATEGORY_BREAKDOWN = """
+    SELECT category, SUM(amount), SUM(SUM(amount)) OVER () FROM expenses
+    WHERE date_int >= ? AND date_int < ?
+    GROUP BY category
+    ORDER BY SUM(amount) DESC
+"""
+_SQL_BUDGET_STATUS = """
+    SELECT bl.category, bl.monthly_limit, COALESCE(SUM(e.amount), 0)
+    FROM budget_limits bl
+    LEFT JOIN expenses e
+        ON e.category = bl.category AND e.date_int >= ? AND e.date_int < ?
+    GROUP BY bl.category, bl.monthly_limit
+    ORDER BY bl.category
+"""
+_SQL_OVERSPENDING = """
+    SELECT bl.category, bl.monthly_limit, SUM(e.amount) AS spent
+    FROM budget_limits bl
+    JOIN expenses e
+        ON e.category = bl.category AND e.date_int >= ? AND e.date_int < ?
+    GROUP BY bl.category, bl.monthly_limit
+    HAVING spent > bl.monthly_limit
+    ORDER BY bl.category
+"""
+
+# Income and expenses are searched in one statement, newest entries first. The table
+# each row came from is the trailing column, so rows can be handed to
+# from_row_unchecked unsliced.
+_SQL_SEARCH_TEMPLATE = f"""
+    SELECT {_INCOME_COLUMNS}, 'income' AS kind FROM income
+    WHERE {{negate}} (source LIKE ? OR description LIKE ?)
+    UNION ALL
+    SELECT {_EXPENSE_COLUMNS}, 'expenses' FROM expenses
+    WHERE {{negate}} (category LIKE ? OR description LIKE ?)
+    ORDER BY date DESC, id DESC
+"""
+_SQL_SEARCH = _SQL_SEARCH_TEMPLATE.format(negate="")
+_SQL_SEARCH_EXCLUDE = _SQL_SEARCH_TEMPLATE.format(negate="NOT")
+
 
-@dataclass
+def _day_number(date_string: str) -> int:
+    """Convert a YYYY-MM-DD date to the day number stored in date_int."""
+    return date.fromisoformat(date_string).toordinal() - _EPOCH_ORDINAL
+
+
+@lru_cache(maxsize=512)
+def _month_bounds(year: int, month: int) -> Tuple[int, int]:
+    """
+    Return the day numbers of the first day of a month and of the next month.
+
+    Reports ask for the same few months over and over, so the bounds are cached.
+    """
+    start_day = date(year, month, 1).toordinal() - _EPOCH_ORDINAL
+    if month == 12:
+        end_day = date(year + 1, 1, 1).toordinal() - _EPOCH_ORDINAL
+    else:
+        end_day = date(year, month + 1, 1).toordinal() - _EPOCH_ORDINAL
+    return start_day, end_day
+
+
+def monthly_totals(dates: np.ndarray, amounts: np.ndarray, start_year: int, start_month: int,
+                   months: int) -> np.ndarray:
+    """
+    Sum amounts into consecutive calendar months.
+
+    Args:
+        dates: Entry dates as day numbers (days since 1970-01-01)
+        amounts: Entry amounts, aligned with dates
+        start_year: Year of the first month
+        start_month: First month (1-12)
+        months: Number of months to total
+
+    Returns:
+        np.ndarray: Total per month, starting at start_year/start_month.
+        Entries outside the months are ignored.
+    """
+    month_index = dates.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    month_index -= (start_year - 1970) * 12 + start_month - 1
+    in_range = (month_index >= 0) & (month_index < months)
+    return np.bincount(month_index[in_range], weights=amounts[in_range], minlength=months)
+
+
+def _compute_status(limits: np.ndarray, spent: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute budget figures for every category at once.
+
+    Args:
+        limits: Monthly limit per category
+        spent: Amount spent per category, aligned with limits
+
+    Returns:
+        Tuple of (remaining, percentage_used, is_over_budget) arrays. The
+        percentage is 0 for categories with a limit of 0.
+    """
+    has_limit = limits > 0
+    percentage_used = np.divide(spent, limits, out=np.zeros_like(spent), where=has_limit) * 100
+    return limits - spent, percentage_used, spent > limits
+
+
+def _new_unchecked(cls, **fields):
+    """Create a frozen dataclass instance from already-validated fields, bypassing __init__."""
+    instance = object.__new__(cls)
+    for name, value in fields.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+@dataclass(slots=True, frozen=True)
 class IncomeEntry:
     """
     Data class representing an income entry.
@@ -44,8 +252,15 @@ class IncomeEntry:
         if not self.source.strip():
             raise ValueError("Income source cannot be empty")
 
+    @classmethod
+    def from_row_unchecked(cls, row: tuple) -> "IncomeEntry":
+        """Build an entry from an income table row, skipping validation."""
+        # Sources repeat across many entries, so loaded entries share one interned string
+        return _new_unchecked(cls, id=row[0], date=row[1], source=intern(row[2]), amount=row[3],
+                               description=row[4], alias=row[5])
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AliasEntry:
     """
     Data class representing a category/source alias.
@@ -70,8 +285,13 @@ class AliasEntry:
         if self.type not in ['income', 'expenses']:
             raise ValueError("Alias type must be 'income' or 'expenses'")
 
+    @classmethod
+    def from_row_unchecked(cls, row: tuple) -> "AliasEntry":
+        """Build an entry from an aliases table row, skipping validation."""
+        return _new_unchecked(cls, id=row[0], alias=row[1], full_name=row[2], type=row[3])
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExpenseEntry:
     """Data class representing an expense entry."""
     id: Optional[int] = None
@@ -88,8 +308,23 @@ class ExpenseEntry:
         if not self.category.strip():
             raise ValueError("Expense category cannot be empty")
 
+    @classmethod
+    def from_row_unchecked(cls, row: tuple) -> "ExpenseEntry":
+        """Build an entry from an expenses table row, skipping validation."""
+        # Categories repeat across many entries, so loaded entries share one interned string
+        return _new_unchecked(cls, id=row[0], date=row[1], category=intern(row[2]), amount=row[3],
+                               description=row[4], alias=row[5])
+
+
+def _search_result_from_row(row: tuple) -> Tuple[str, Union[IncomeEntry, ExpenseEntry]]:
+    """Build the (kind, entry) pair for a row of the combined search query."""
+    if row[6] == 'income':
+        return 'income', IncomeEntry.from_row_unchecked(row)
+    return 'expenses', ExpenseEntry.from_row_unchecked(row)
 
-@dataclass
+
+
+@dataclass(slots=True, frozen=True)
 class BudgetLimit:
     """Data class representing a budget limit for a category."""
     id: Optional[int] = None
@@ -104,6 +339,22 @@ class BudgetLimit:
         if not self.category.strip():
             raise ValueError("Budget category cannot be empty")
 
+    @classmethod
+    def from_row_unchecked(cls, row: tuple) -> "BudgetLimit":
+        """Build a limit from a budget_limits table row, skipping validation."""
+        return _new_unchecked(cls, id=row[0], category=row[1], monthly_limit=row[2],
+                               description=row[3])
+
+
+class BudgetStatusRow(NamedTuple):
+    """Budget status of one category for a month."""
+    category: str
+    limit: float
+    spent: float
+    remaining: float
+    is_over_budget: bool
+    percentage_used: float
+
 
 class BudgetManager:
     """Manages budget data and database operations."""
@@ -112,17 +363,69 @@ class BudgetManager:
         """Initialize the budget manager with database path."""
         self.db_path = db_path
         self._ensure_data_directory()
+        # A single long-lived connection shared by every method. It runs in
+        # autocommit mode; multi-statement operations open their own transaction.
+        self._conn = self._connect()
+        self._lock = threading.Lock()
+        # Monthly summaries keyed by (kind, year, month), each stored with the data
+        # epoch it was computed at. Every income, expense and budget limit write, and
+        # replace_alias (which rewrites sources and categories), bumps the epoch,
+        # which makes all previously cached summaries stale.
+        self._summary_cache: Dict[tuple, tuple] = {}
+        self._data_epoch = 0
         self._init_database()
     
     def _ensure_data_directory(self) -> None:
         """Ensure the data directory exists."""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the database with the manager's PRAGMAs applied."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                               cached_statements=256)
+        # journal_mode is stored in the database file; an in-memory database has
+        # no file and cannot use WAL. The rest apply to this connection only.
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        return conn
+
+    def close(self) -> None:
+        """Close the database connection, refreshing planner statistics first if needed."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.error("Database error: %s", e)
+            self._conn.close()
+
+    def vacuum_and_analyze(self) -> None:
+        """
+        Rebuild the database file and refresh the query planner statistics.
+
+        Worth running occasionally after many deletes or a large import.
+
+        Raises:
+            ValueError: If a database error occurs
+        """
+        try:
+            with self._lock:
+                self._conn.execute("VACUUM")
+                self._conn.execute("ANALYZE")
+        except sqlite3.Error as e:
+            raise ValueError(f"Database error: {e}")
     
     def _init_database(self) -> None:
         """Initialize the SQLite database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
+        with self._lock:
+            cursor = self._conn.cursor()
+
             # Income table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS \"income\" (
@@ -171,8 +474,82 @@ class BudgetManager:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            
-            conn.commit()
+
+            # Databases created before date_int existed get the column added here;
+            # it is virtual, so no rows need rewriting.
+            for table_name in ("income", "expenses"):
+                columns = {row[1] for row in cursor.execute(f"PRAGMA table_xinfo({table_name})")}
+                if "date_int" not in columns:
+                    cursor.execute(f"""
+                        ALTER TABLE {table_name}
+                        ADD COLUMN date_int INTEGER GENERATED ALWAYS AS ({_DATE_INT_EXPR}) VIRTUAL
+                    """)
+
+            self._create_indexes(cursor)
+
+            # Give the planner statistics to choose between the date and
+            # category+date indexes. Later refreshes happen via PRAGMA optimize.
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
+
+    @staticmethod
+    def _create_indexes(cursor: sqlite3.Cursor) -> None:
+        """Create the indexes used by the date, category and alias lookups."""
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_income_date ON income(date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date_int ON expenses(date_int)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_expenses_cat_date_int ON expenses(category, date_int)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_income_date_int ON income(date_int)")
+        # Listing the aliases of one table; (alias, type) lookups use the UNIQUE index
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_aliases_type_alias ON aliases(type, alias)")
+        # Superseded by idx_expenses_cat_date_int
+        cursor.execute("DROP INDEX IF EXISTS idx_expenses_cat_date")
+
+    def _select_entries(self, entry_type, sql: str, params: tuple = ()) -> list:
+        """
+        Run a read query and convert every row with entry_type.from_row_unchecked.
+
+        Database errors are reported and produce an empty list, like the other
+        read paths.
+        """
+        try:
+            with self._lock:
+                return list(map(entry_type.from_row_unchecked, self._conn.execute(sql, params)))
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return []
+
+    def _load_arrays(self, sql: str, start_date: str, end_date: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run a (date_int, amount, label) query and return its columns as arrays."""
+        try:
+            with self._lock:
+                # Rows stream from the cursor straight into one record array, with no
+                # intermediate list of tuples
+                cursor = self._conn.execute(sql, (_day_number(start_date), _day_number(end_date)))
+                records = np.fromiter(cursor, dtype=_ARRAY_ROW_DTYPE)
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            records = np.empty(0, dtype=_ARRAY_ROW_DTYPE)
+
+        return records['date_int'].copy(), records['amount'].copy(), records['label'].copy()
+
+    def _iter_entries(self, from_row, sql: str, params: tuple, batch_size: int) -> Iterator:
+        """Yield from_row(row) for the rows of a query, fetched batch_size at a time."""
+        cursor = self._conn.cursor()
+        try:
+            with self._lock:
+                cursor.execute(sql, params)
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield from map(from_row, rows)
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+        finally:
+            cursor.close()
 
     def reindex_table(self, table_name: str) -> bool:
         """
@@ -181,23 +558,40 @@ class BudgetManager:
         ⚠️ WARNING: This is a destructive operation. It should not be used on
         tables that are referenced by foreign keys in other tables.
 
+        Tables whose ids already run 1..n are left as they are; only the
+        AUTOINCREMENT counter is reset.
+
         Args:
             table_name: The name of the table to re-index (e.g., 'income').
 
         Returns:
             bool: True if the operation was successful, False otherwise.
+
+        Raises:
+            ValueError: If the table cannot be re-indexed or a database error occurs
         """
+        if table_name not in _REINDEXABLE_TABLES:
+            raise ValueError(f"Cannot re-index table {table_name!r}")
         temp_table_name = f"{table_name}_temp"
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._lock, self._conn:
+                cursor = self._conn.cursor()
 
                 # Start a transaction
-                cursor.execute("BEGIN TRANSACTION;")
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Ids are unique and positive, so they are already 1..n when the
+                # largest equals the row count
+                count, max_id = cursor.execute(
+                    f"SELECT COUNT(*), COALESCE(MAX(id), 0) FROM {table_name}"
+                ).fetchone()
+                if count == max_id:
+                    cursor.execute(_SQL_RESET_SEQUENCE, (table_name,))
+                    return True
 
                 # 1. Get the original table's CREATE statement
-                cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name='{table_name}'")
+                cursor.execute(_SQL_TABLE_SCHEMA, (table_name,))
                 create_sql = cursor.fetchone()[0]
 
                 # 2. Create the temporary table with the same schema
@@ -223,10 +617,12 @@ class BudgetManager:
                 cursor.execute(f"ALTER TABLE {temp_table_name} RENAME TO {table_name}")
 
                 # 7. If using AUTOINCREMENT, reset the sequence counter
-                cursor.execute(f"DELETE FROM sqlite_sequence WHERE name='{table_name}'")
+                cursor.execute(_SQL_RESET_SEQUENCE, (table_name,))
+
+                # 8. Dropping the original table also dropped its indexes
+                self._create_indexes(cursor)
 
-                # Commit the transaction
-                conn.commit()
+                self._data_epoch += 1
                 return True
 
         except sqlite3.Error as e:
@@ -246,17 +642,39 @@ class BudgetManager:
             int: ID of the created income entry
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO income (date, source, amount, description, alias)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (income.date, income.source, income.amount, income.description, income.alias))
-                conn.commit()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_ADD_INCOME, (income.date, income.source, income.amount, income.description, income.alias))
+                self._data_epoch += 1
                 return cursor.lastrowid
         except sqlite3.Error as e:
             raise ValueError(f"Database error: {e}")
 
+    def add_incomes_bulk(self, incomes: List[IncomeEntry]) -> int:
+        """
+        Add many income entries in a single transaction.
+
+        The insert statement is prepared once and run for every entry, and the
+        whole batch is committed together, so a large import pays for one commit
+        instead of one per row.
+
+        Args:
+            incomes: IncomeEntry objects to add
+
+        Returns:
+            int: Number of income entries added
+        """
+        rows = [(income.date, income.source, income.amount, income.description, income.alias)
+                for income in incomes]
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                cursor = self._conn.executemany(_SQL_ADD_INCOME, rows)
+                self._data_epoch += 1
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            raise ValueError(f"Database error: {e}")
+
     def delete_income(self, id_input: int) -> IncomeEntry:
         """
         Add a new income entry to the database.
@@ -272,33 +690,15 @@ class BudgetManager:
             AssertionError: If it deletes multiple entries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                # Get deleted contents
-                cursor.execute("""
-                    SELECT * FROM income WHERE id = ?
-                """, (id_input,))
-
-                deleted_row = cursor.fetchone()
-
-                # Delete contents
-                cursor.execute("""
-                    DELETE FROM income WHERE id = ?
-                """, (id_input,))
-                conn.commit()
-                n_deleted_rows = cursor.rowcount  # will be 1 if delete works
-
-                assert(n_deleted_rows <= 1), "Multiple rows deleted" # Should never have duplicate ids
-                if n_deleted_rows == 1:
+            with self._lock:
+                # Delete and get the deleted contents in one statement
+                deleted_rows = self._conn.execute(_SQL_DELETE_INCOME, (id_input,)).fetchall()
+                self._data_epoch += 1
+
+                assert(len(deleted_rows) <= 1), "Multiple rows deleted" # Should never have duplicate ids
+                if deleted_rows:
                     # return deleted entry
-                    return IncomeEntry(
-                        id=deleted_row[0],
-                        date=deleted_row[1],
-                        source=deleted_row[2],
-                        amount=deleted_row[3],
-                        description=deleted_row[4] or "",
-                        alias=deleted_row[5] or ""
-                    )
+                    return IncomeEntry.from_row_unchecked(deleted_rows[0])
                 else:
                     raise KeyError(f"Income entry with id {id_input} was not found")
 
@@ -307,66 +707,55 @@ class BudgetManager:
     
     def get_all_income(self) -> List[IncomeEntry]:
         """Get all income entries."""
-        income_entries = []
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM income ORDER BY date ASC, created_at ASC")
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    income = IncomeEntry(
-                        id=row[0],
-                        date=row[1],
-                        source=row[2],
-                        amount=row[3],
-                        description=row[4] or "",
-                        alias=row[5] or None
-                    )
-                    income_entries.append(income)
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-        
-        return income_entries
+        return self._select_entries(IncomeEntry, _SQL_ALL_INCOME)
     
     def get_income_by_date_range(self, start_date: str, end_date: str) -> List[IncomeEntry]:
         """Get income entries within a date range."""
-        income_entries = []
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM income 
-                    WHERE date >= ? AND date <= ? 
-                    ORDER BY date ASC, created_at ASC
-                """, (start_date, end_date))
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    income = IncomeEntry(
-                        id=row[0],
-                        date=row[1],
-                        source=row[2],
-                        amount=row[3],
-                        description=row[4] or "",
-                        alias=row[5] or None
-                    )
-                    income_entries.append(income)
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-        
-        return income_entries
+        return self._select_entries(IncomeEntry, _SQL_INCOME_BY_DATE_RANGE,
+                                    (_day_number(start_date), _day_number(end_date)))
     
+    def iter_income_by_date_range(self, start_date: str, end_date: str,
+                                  batch_size: int = 500) -> Iterator[IncomeEntry]:
+        """
+        Lazily yield income entries within a date range.
+
+        Rows are fetched in batches, so callers that only sum or filter never hold
+        the whole range in memory. The database lock is held only while a batch is
+        being fetched.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            IncomeEntry: The next income entry in date order
+        """
+        yield from self._iter_entries(IncomeEntry.from_row_unchecked, _SQL_INCOME_BY_DATE_RANGE,
+                                      (_day_number(start_date), _day_number(end_date)), batch_size)
+
+    def get_income_arrays(self, start_date: str, end_date: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get income within a date range as column arrays for numeric analysis.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            Tuple of (dates, amounts, sources) in date order. Dates are day
+            numbers since 1970-01-01 (int64), amounts are float64.
+        """
+        return self._load_arrays(_SQL_INCOME_ARRAYS, start_date, end_date)
+
     def get_total_income_by_month(self, year: int, month: int) -> float:
         """Calculate total income for a specific month."""
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year + 1}-01-01"
-        else:
-            end_date = f"{year}-{month + 1:02d}-01"
-        
-        income_entries = self.get_income_by_date_range(start_date, end_date)
-        return sum(income.amount for income in income_entries)
+        try:
+            with self._lock:
+                return self._conn.execute(_SQL_TOTAL_INCOME, _month_bounds(year, month)).fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return 0.0
     
     # Expense operations
     def add_expense(self, expense: ExpenseEntry) -> int:
@@ -380,17 +769,35 @@ class BudgetManager:
             int: ID of the created expense entry
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO expenses (date, category, amount, description, alias)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (expense.date, expense.category, expense.amount, expense.description, expense.alias))
-                conn.commit()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_ADD_EXPENSE, (expense.date, expense.category, expense.amount, expense.description, expense.alias))
+                self._data_epoch += 1
                 return cursor.lastrowid
         except sqlite3.Error as e:
             raise ValueError(f"Database error: {e}")
 
+    def add_expenses_bulk(self, expenses: List[ExpenseEntry]) -> int:
+        """
+        Add many expense entries in a single transaction.
+
+        Args:
+            expenses: ExpenseEntry objects to add
+
+        Returns:
+            int: Number of expense entries added
+        """
+        rows = [(expense.date, expense.category, expense.amount, expense.description, expense.alias)
+                for expense in expenses]
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                cursor = self._conn.executemany(_SQL_ADD_EXPENSE, rows)
+                self._data_epoch += 1
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            raise ValueError(f"Database error: {e}")
+
     def delete_expense(self, id_input: int) -> ExpenseEntry:
         """
         Add a new income entry to the database.
@@ -406,33 +813,15 @@ class BudgetManager:
             AssertionError: If it deletes multiple entries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                # Get deleted contents
-                cursor.execute("""
-                    SELECT * FROM expenses WHERE id = ?
-                """, (id_input, ))
-
-                deleted_row = cursor.fetchone()
-
-                # Delete contents
-                cursor.execute("""
-                    DELETE FROM expenses WHERE id = ?
-                """, (id_input, ))
-                conn.commit()
-                n_deleted_rows = cursor.rowcount  # will be 1 if delete works
-
-                assert(n_deleted_rows <= 1), "Multiple rows deleted" # Should never have duplicate ids
-                if n_deleted_rows == 1:
+            with self._lock:
+                # Delete and get the deleted contents in one statement
+                deleted_rows = self._conn.execute(_SQL_DELETE_EXPENSE, (id_input,)).fetchall()
+                self._data_epoch += 1
+
+                assert(len(deleted_rows) <= 1), "Multiple rows deleted" # Should never have duplicate ids
+                if deleted_rows:
                     # return deleted entry
-                    return ExpenseEntry(
-                        id=deleted_row[0],
-                        date=deleted_row[1],
-                        category=deleted_row[2],
-                        amount=deleted_row[3],
-                        description=deleted_row[4] or "",
-                        alias=deleted_row[5] or None
-                    )
+                    return ExpenseEntry.from_row_unchecked(deleted_rows[0])
                 else:
                     raise KeyError(f"Expense entry with id {id_input} was not found")
 
@@ -441,101 +830,64 @@ class BudgetManager:
     
     def get_all_expenses(self) -> List[ExpenseEntry]:
         """Get all expense entries."""
-        expense_entries = []
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM expenses ORDER BY date ASC, created_at ASC")
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    expense = ExpenseEntry(
-                        id=row[0],
-                        date=row[1],
-                        category=row[2],
-                        amount=row[3],
-                        description=row[4] or "",
-                        alias=row[5] or None
-                    )
-                    expense_entries.append(expense)
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-        
-        return expense_entries
+        return self._select_entries(ExpenseEntry, _SQL_ALL_EXPENSES)
     
     def get_expenses_by_category(self, category: str) -> List[ExpenseEntry]:
         """Get all expenses in a specific category."""
-        expense_entries = []
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM expenses WHERE category = ? ORDER BY date ASC", (category,))
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    expense = ExpenseEntry(
-                        id=row[0],
-                        date=row[1],
-                        category=row[2],
-                        amount=row[3],
-                        description=row[4] or "",
-                        alias=row[5] or None
-                    )
-                    expense_entries.append(expense)
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-        
-        return expense_entries
+        return self._select_entries(ExpenseEntry, _SQL_EXPENSES_BY_CATEGORY, (category,))
     
     def get_expenses_by_date_range(self, start_date: str, end_date: str) -> List[ExpenseEntry]:
         """Get expense entries within a date range."""
-        expense_entries = []
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM expenses 
-                    WHERE date >= ? AND date <= ? 
-                    ORDER BY date ASC, created_at ASC
-                """, (start_date, end_date))
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    expense = ExpenseEntry(
-                        id=row[0],
-                        date=row[1],
-                        category=row[2],
-                        amount=row[3],
-                        description=row[4] or "",
-                        alias=row[5] or None
-                    )
-                    expense_entries.append(expense)
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-        
-        return expense_entries
+        return self._select_entries(ExpenseEntry, _SQL_EXPENSES_BY_DATE_RANGE,
+                                    (_day_number(start_date), _day_number(end_date)))
     
+    def iter_expenses_by_date_range(self, start_date: str, end_date: str,
+                                    batch_size: int = 500) -> Iterator[ExpenseEntry]:
+        """
+        Lazily yield expense entries within a date range.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            ExpenseEntry: The next expense entry in date order
+        """
+        yield from self._iter_entries(ExpenseEntry.from_row_unchecked, _SQL_EXPENSES_BY_DATE_RANGE,
+                                      (_day_number(start_date), _day_number(end_date)), batch_size)
+
+    def get_expenses_arrays(self, start_date: str, end_date: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get expenses within a date range as column arrays for numeric analysis.
+
+        Args:
+            start_date: First date of the range (inclusive)
+            end_date: Last date of the range (inclusive)
+
+        Returns:
+            Tuple of (dates, amounts, categories) in date order. Dates are day
+            numbers since 1970-01-01 (int64), amounts are float64.
+        """
+        return self._load_arrays(_SQL_EXPENSE_ARRAYS, start_date, end_date)
+
     def get_total_expenses_by_month(self, year: int, month: int) -> float:
         """Calculate total expenses for a specific month."""
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year + 1}-01-01"
-        else:
-            end_date = f"{year}-{month + 1:02d}-01"
-        
-        expense_entries = self.get_expenses_by_date_range(start_date, end_date)
-        return sum(expense.amount for expense in expense_entries)
+        try:
+            with self._lock:
+                return self._conn.execute(_SQL_TOTAL_EXPENSES, _month_bounds(year, month)).fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return 0.0
     
     def get_expenses_by_category_and_month(self, category: str, year: int, month: int) -> float:
         """Calculate total expenses for a specific category in a month."""
-        start_date = f"{year}-{month:02d}-01"
-        if month == 12:
-            end_date = f"{year + 1}-01-01"
-        else:
-            end_date = f"{year}-{month + 1:02d}-01"
-        
-        expense_entries = self.get_expenses_by_date_range(start_date, end_date)
-        return sum(expense.amount for expense in expense_entries if expense.category == category)
+        try:
+            with self._lock:
+                return self._conn.execute(_SQL_CATEGORY_TOTAL, (category, *_month_bounds(year, month))).fetchone()[0]
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return 0.0
 
     # Alias operations
     def add_alias(self, alias: AliasEntry) -> int:
@@ -552,13 +904,9 @@ class BudgetManager:
             ValueError: SQL database error
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO aliases (alias, full_name, type) 
-                    VALUES (?, ?, ?)
-                """, (alias.alias, alias.full_name, alias.type))
-                conn.commit()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_ADD_ALIAS, (alias.alias, alias.full_name, alias.type))
                 return cursor.lastrowid
 
         except sqlite3.IntegrityError:
@@ -567,6 +915,32 @@ class BudgetManager:
         except sqlite3.Error as e:
             raise ValueError(f"Database error: {e}")
 
+    def add_aliases_bulk(self, aliases: List[AliasEntry]) -> int:
+        """
+        Add many alias entries in a single transaction.
+
+        Args:
+            aliases: Alias entries to add
+
+        Returns:
+            int: Number of aliases added
+
+        Raises:
+            KeyError: If any alias already exists for its table; none are added then
+            ValueError: SQL database error
+        """
+        rows = [(alias.alias, alias.full_name, alias.type) for alias in aliases]
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                return self._conn.executemany(_SQL_ADD_ALIAS, rows).rowcount
+
+        except sqlite3.IntegrityError as e:
+            # This happens if an alias is not unique
+            raise KeyError(f"Alias already exists: {e}")
+        except sqlite3.Error as e:
+            raise ValueError(f"Database error: {e}")
+
     def get_alias(self, alias: str, table: str) -> AliasEntry | None:
         """
         Resolve an alias entry.
@@ -579,20 +953,11 @@ class BudgetManager:
             AliasEntry | None: The resolved alias entry, or ``None`` if the alias does not exist
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM aliases WHERE alias = ? AND type = ?
-                """, (alias, table))
-                alias = cursor.fetchone()
+            with self._lock:
+                alias = self._conn.execute(_SQL_ALIAS, (alias, table)).fetchone()
 
                 if alias:
-                    return AliasEntry(
-                        id=alias[0],
-                        alias=alias[1],
-                        full_name=alias[2],
-                        type=alias[3]
-                    )
+                    return AliasEntry.from_row_unchecked(alias)
                 else: # No match found
                     return None
 
@@ -612,27 +977,13 @@ class BudgetManager:
         aliases = []
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
+            with self._lock:
                 if table.lower() == "all":
-                    cursor.execute("""
-                        SELECT * FROM aliases
-                    """)
+                    cursor = self._conn.execute(_SQL_ALL_ALIASES)
                 else:
-                    cursor.execute("""
-                        SELECT * FROM aliases WHERE type = ?
-                    """, (table, ))
-
-                rows = cursor.fetchall()
+                    cursor = self._conn.execute(_SQL_ALIASES_BY_TYPE, (table, ))
 
-                for row in rows:
-                    aliases.append(AliasEntry(
-                        id=row[0],
-                        alias=row[1],
-                        full_name=row[2],
-                        type=row[3]
-                    ))
+                aliases = list(map(AliasEntry.from_row_unchecked, cursor))
 
         except sqlite3.Error as e:
             raise ValueError(f"Database error: {e}")
@@ -656,31 +1007,14 @@ class BudgetManager:
             ValueError: If a database error occurs
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                # Get deleted contents
-                cursor.execute("""
-                    SELECT * FROM aliases WHERE alias = ? AND type = ?
-                """, (alias, table))
-
-                deleted_row = cursor.fetchone()
-
-                # Delete contents
-                cursor.execute("""
-                    DELETE FROM aliases WHERE alias = ? AND type = ?
-                """, (alias, table))
-                conn.commit()
-                n_deleted_rows = cursor.rowcount  # will be 1 if delete works
-
-                assert(n_deleted_rows <= 1), "Multiple rows deleted" # Should never have duplicates
-                if n_deleted_rows == 1:
+            with self._lock:
+                # Delete and get the deleted contents in one statement
+                deleted_rows = self._conn.execute(_SQL_DELETE_ALIAS, (alias, table)).fetchall()
+
+                assert(len(deleted_rows) <= 1), "Multiple rows deleted" # Should never have duplicates
+                if deleted_rows:
                     # return deleted entry
-                    return AliasEntry(
-                        id=deleted_row[0],
-                        alias=deleted_row[1],
-                        full_name=deleted_row[2],
-                        type=deleted_row[3]
-                    )
+                    return AliasEntry.from_row_unchecked(deleted_rows[0])
                 else:
                     raise KeyError(f"Alias entry for the {table} table with alias {alias} was not found")
 
@@ -701,47 +1035,33 @@ class BudgetManager:
             tuple[AliasEntry, AliasEntry]: A tuple (old_alias_entry, new_alias_entry)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            with self._lock, self._conn:
+                cursor = self._conn.cursor()
 
                 # Start a transaction
                 cursor.execute("BEGIN TRANSACTION;")
                 # Update alias table
-                cursor.execute("""SELECT * FROM aliases WHERE alias = ? AND type = ?""",
-                               (old_alias, table))
+                cursor.execute(_SQL_ALIAS, (old_alias, table))
                 replaced_row = cursor.fetchone()
 
-                cursor.execute("""UPDATE aliases SET alias = ?, full_name = ? WHERE alias = ? AND type = ?""",
-                               (new_alias, new_full_name, old_alias, table))
-                cursor.execute("""SELECT * FROM aliases WHERE alias = ? AND type = ?""",
-                               (new_alias, table))
+                cursor.execute(_SQL_RENAME_ALIAS, (new_alias, new_full_name, old_alias, table))
+                cursor.execute(_SQL_ALIAS, (new_alias, table))
                 new_row = cursor.fetchone()
 
                 # Update other table
                 match table:
                     case "income":
-                        cursor.execute("""UPDATE income SET alias = ?, source = ? WHERE alias = ?
-                        """, (new_alias, new_full_name, old_alias))
+                        cursor.execute(_SQL_RENAME_INCOME_ALIAS, (new_alias, new_full_name, old_alias))
                     case "expenses":
-                        cursor.execute("""UPDATE expenses SET alias = ?, category = ? WHERE alias = ?
-                        """, (new_alias, new_full_name, old_alias))
+                        cursor.execute(_SQL_RENAME_EXPENSE_ALIAS, (new_alias, new_full_name, old_alias))
                     case _:
                         raise ValueError(f"Unknown table {type}")
-                conn.commit()
+
+                self._data_epoch += 1
 
                 # Return both aliases
-                old_alias = AliasEntry(
-                    id=replaced_row[0],
-                    alias=replaced_row[1],
-                    full_name=replaced_row[2],
-                    type=replaced_row[3]
-                )
-                new_alias = AliasEntry(
-                    id=new_row[0],
-                    alias=new_row[1],
-                    full_name=new_row[2],
-                    type=new_row[3]
-                )
+                old_alias = AliasEntry.from_row_unchecked(replaced_row)
+                new_alias = AliasEntry.from_row_unchecked(new_row)
                 return old_alias, new_alias
 
         except sqlite3.Error as e:
@@ -759,99 +1079,162 @@ class BudgetManager:
             int: ID of the created/updated budget limit
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO budget_limits (category, monthly_limit, description)
-                    VALUES (?, ?, ?)
-                """, (budget_limit.category, budget_limit.monthly_limit, budget_limit.description))
-                conn.commit()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_SET_BUDGET_LIMIT, (budget_limit.category, budget_limit.monthly_limit, budget_limit.description))
+                self._data_epoch += 1
                 return cursor.lastrowid
         except sqlite3.Error as e:
             raise ValueError(f"Database error: {e}")
     
-    def get_all_budget_limits(self) -> List[BudgetLimit]:
-        """Get all budget limits."""
-        budget_limits = []
+    def set_budget_limits_bulk(self, budget_limits: List[BudgetLimit]) -> int:
+        """
+        Set or update many budget limits in a single transaction.
+
+        Args:
+            budget_limits: BudgetLimit objects to store
+
+        Returns:
+            int: Number of budget limits written
+        """
+        rows = [(budget_limit.category, budget_limit.monthly_limit, budget_limit.description)
+                for budget_limit in budget_limits]
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM budget_limits ORDER BY category")
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    budget_limit = BudgetLimit(
-                        id=row[0],
-                        category=row[1],
-                        monthly_limit=row[2],
-                        description=row[3] or ""
-                    )
-                    budget_limits.append(budget_limit)
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                cursor = self._conn.executemany(_SQL_SET_BUDGET_LIMIT, rows)
+                self._data_epoch += 1
+                return cursor.rowcount
         except sqlite3.Error as e:
-            print(f"Database error: {e}")
-        
-        return budget_limits
+            raise ValueError(f"Database error: {e}")
+
+    def bulk_load(self, incomes: List[IncomeEntry] = (), expenses: List[ExpenseEntry] = (),
+                  budget_limits: List[BudgetLimit] = ()) -> Tuple[int, int, int]:
+        """
+        Load income, expenses and budget limits together in a single transaction.
+
+        Either everything is stored or, if any insert fails, nothing is.
+
+        Args:
+            incomes: IncomeEntry objects to add
+            expenses: ExpenseEntry objects to add
+            budget_limits: BudgetLimit objects to store
+
+        Returns:
+            Tuple[int, int, int]: Number of income entries, expense entries and
+            budget limits written
+        """
+        income_rows = [(income.date, income.source, income.amount, income.description, income.alias)
+                       for income in incomes]
+        expense_rows = [(expense.date, expense.category, expense.amount, expense.description, expense.alias)
+                        for expense in expenses]
+        limit_rows = [(budget_limit.category, budget_limit.monthly_limit, budget_limit.description)
+                      for budget_limit in budget_limits]
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                added_income = self._conn.executemany(_SQL_ADD_INCOME, income_rows).rowcount
+                added_expenses = self._conn.executemany(_SQL_ADD_EXPENSE, expense_rows).rowcount
+                written_limits = self._conn.executemany(_SQL_SET_BUDGET_LIMIT, limit_rows).rowcount
+                self._data_epoch += 1
+                return added_income, added_expenses, written_limits
+        except sqlite3.Error as e:
+            raise ValueError(f"Database error: {e}")
+
+    def get_all_budget_limits(self) -> List[BudgetLimit]:
+        """Get all budget limits."""
+        return self._select_entries(BudgetLimit, _SQL_ALL_BUDGET_LIMITS)
     
     def get_budget_limit(self, category: str) -> Optional[BudgetLimit]:
         """Get budget limit for a specific category."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM budget_limits WHERE category = ?", (category,))
-                row = cursor.fetchone()
-                
-                if row:
-                    return BudgetLimit(
-                        id=row[0],
-                        category=row[1],
-                        monthly_limit=row[2],
-                        description=row[3] or ""
-                    )
+            with self._lock:
+                row = self._conn.execute(_SQL_BUDGET_LIMIT, (category,)).fetchone()
         except sqlite3.Error as e:
-            print(f"Database error: {e}")
-        
-        return None
+            logger.error("Database error: %s", e)
+            return None
+
+        return BudgetLimit.from_row_unchecked(row) if row else None
     
     def delete_budget_limit(self, category: str) -> bool:
         """Delete a budget limit for a category."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM budget_limits WHERE category = ?", (category,))
-                conn.commit()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_DELETE_BUDGET_LIMIT, (category,))
+                self._data_epoch += 1
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
-            print(f"Database error: {e}")
+            logger.error("Database error: %s", e)
             return False
     
     # Budget analysis methods
-    def get_budget_status(self, year: int, month: int) -> Dict[str, Dict]:
+    def _cached_summary(self, kind: str, year: int, month: int, compute):
+        """
+        Return a monthly summary, recomputing it only if data changed since it was cached.
+
+        The cache is only valid for writes made through this BudgetManager. Writes
+        from another BudgetManager or process on the same database file do not bump
+        _data_epoch, so summaries cached here can be stale until this instance writes.
+        Adding and deleting aliases leave the epoch alone, since no summary reads them.
+
+        Args:
+            kind: Name of the summary, used as part of the cache key
+            year: Year of the summary
+            month: Month of the summary
+            compute: Callable taking (year, month) that builds the summary
+
+        Returns:
+            The cached or freshly computed summary
+        """
+        key = (kind, year, month)
+        # Read the epoch before computing, so a write that lands mid-computation
+        # leaves the stored entry stale rather than silently current.
+        epoch = self._data_epoch
+        cached = self._summary_cache.get(key)
+        if cached is not None and cached[0] == epoch:
+            return cached[1]
+
+        summary = compute(year, month)
+        self._summary_cache[key] = (epoch, summary)
+        return summary
+
+    def get_budget_status(self, year: int, month: int) -> List[BudgetStatusRow]:
         """
         Get budget status for a specific month.
         
         Returns:
-            Dict with category status information
+            List[BudgetStatusRow]: Status of every category with a budget limit,
+            ordered by category
         """
-        budget_limits = self.get_all_budget_limits()
-        budget_status = {}
-        
-        for budget_limit in budget_limits:
-            spent = self.get_expenses_by_category_and_month(budget_limit.category, year, month)
-            remaining = budget_limit.monthly_limit - spent
-            percentage_used = (spent / budget_limit.monthly_limit * 100) if budget_limit.monthly_limit > 0 else 0
-            
-            budget_status[budget_limit.category] = {
-                'limit': budget_limit.monthly_limit,
-                'spent': spent,
-                'remaining': remaining,
-                'percentage_used': percentage_used,
-                'is_over_budget': spent > budget_limit.monthly_limit
-            }
-        
-        return budget_status
+        return list(self._cached_summary("budget_status", year, month, self._load_budget_status))
+
+    def _load_budget_status(self, year: int, month: int) -> List[BudgetStatusRow]:
+        """Query the budget status for a month, bypassing the summary cache."""
+        try:
+            with self._lock:
+                rows = self._conn.execute(_SQL_BUDGET_STATUS, _month_bounds(year, month)).fetchall()
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return []
+
+        if not rows:
+            return []
+
+        categories, limits, spent = zip(*rows)
+        limits = np.array(limits, dtype=np.float64)
+        spent = np.array(spent, dtype=np.float64)
+        remaining, percentage_used, is_over_budget = _compute_status(limits, spent)
+
+        return list(map(BudgetStatusRow, categories, limits.tolist(), spent.tolist(), remaining.tolist(),
+                        is_over_budget.tolist(), percentage_used.tolist()))
     
     def get_monthly_summary(self, year: int, month: int) -> Dict[str, float]:
         """Get monthly financial summary."""
+        return dict(self._cached_summary("monthly_summary", year, month, self._load_monthly_summary))
+
+    def _load_monthly_summary(self, year: int, month: int) -> Dict[str, float]:
+        """Compute the monthly summary, bypassing the summary cache."""
         total_income = self.get_total_income_by_month(year, month)
         total_expenses = self.get_total_expenses_by_month(year, month)
         net_income = total_income - total_expenses
@@ -865,90 +1248,108 @@ class BudgetManager:
     
     def get_category_summary(self, year: int, month: int) -> Dict[str, float]:
         """Get spending summary by category for a month."""
-        expense_entries = self.get_expenses_by_date_range(
-            f"{year}-{month:02d}-01",
-            f"{year}-{month + 1:02d}-01" if month < 12 else f"{year + 1}-01-01"
-        )
-        
-        category_totals = {}
-        for expense in expense_entries:
-            if expense.category not in category_totals:
-                category_totals[expense.category] = 0
-            category_totals[expense.category] += expense.amount
-        
-        return category_totals
+        return dict(self._cached_summary("category_summary", year, month, self._load_category_summary))
+
+    def _load_category_summary(self, year: int, month: int) -> Dict[str, float]:
+        """Query spending by category for a month, bypassing the summary cache."""
+        try:
+            with self._lock:
+                return dict(self._conn.execute(_SQL_CATEGORY_SUMMARY, _month_bounds(year, month)))
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return {}
+    
+    def get_category_breakdown(self, year: int, month: int) -> Tuple[Dict[str, float], float]:
+        """
+        Get spending by category for a month together with the month's total.
+
+        Args:
+            year: Year of the breakdown
+            month: Month of the breakdown
+
+        Returns:
+            Tuple[Dict[str, float], float]: Spending per category, largest first,
+            and total spending across all categories
+        """
+        by_category, total = self._cached_summary("category_breakdown", year, month,
+                                                  self._load_category_breakdown)
+        return dict(by_category), total
+
+    def _load_category_breakdown(self, year: int, month: int) -> Tuple[Dict[str, float], float]:
+        """Query the category breakdown for a month, bypassing the summary cache."""
+        try:
+            with self._lock:
+                by_category = {}
+                total = 0.0
+                for category, amount, total in self._conn.execute(_SQL_CATEGORY_BREAKDOWN,
+                                                                  _month_bounds(year, month)):
+                    by_category[category] = amount
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return {}, 0.0
+
+        return by_category, total
     
     def get_overspending_alerts(self, year: int, month: int) -> List[Dict[str, any]]:
         """Get list of categories that are over budget."""
-        budget_status = self.get_budget_status(year, month)
-        alerts = []
-        
-        for category, status in budget_status.items():
-            if status['is_over_budget']:
-                overspent_amount = status['spent'] - status['limit']
-                alerts.append({
-                    'category': category,
-                    'limit': status['limit'],
-                    'spent': status['spent'],
-                    'overspent': overspent_amount,
-                    'percentage_over': (overspent_amount / status['limit'] * 100) if status['limit'] > 0 else 0
-                })
+        alerts = self._cached_summary("overspending_alerts", year, month, self._load_overspending_alerts)
+        return [dict(alert) for alert in alerts]
+
+    def _load_overspending_alerts(self, year: int, month: int) -> List[Dict[str, any]]:
+        """Query the over-budget categories for a month, bypassing the summary cache."""
+        try:
+            with self._lock:
+                alerts = []
+                for category, monthly_limit, spent in self._conn.execute(_SQL_OVERSPENDING,
+                                                                         _month_bounds(year, month)):
+                    overspent_amount = spent - monthly_limit
+                    alerts.append({
+                        'category': category,
+                        'limit': monthly_limit,
+                        'spent': spent,
+                        'overspent': overspent_amount,
+                        'percentage_over': (overspent_amount / monthly_limit * 100) if monthly_limit > 0 else 0
+                    })
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            return []
         
         return alerts
     
     def search_entries(self, query: str, exclude: bool = False) -> Tuple[List[IncomeEntry], List[ExpenseEntry]]:
         """Search income and expense entries by description or source/category."""
-        query_lower = query.lower()
         matching_income = []
         matching_expenses = []
-        NOT = "NOT" if exclude else ""
+        add_income = matching_income.append
+        add_expense = matching_expenses.append
         
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                # Search income
-                cursor.execute(f"""
-                    SELECT * FROM income 
-                    WHERE {NOT} (LOWER(source) LIKE ? OR LOWER(description) LIKE ?)
-                    ORDER BY date ASC
-                """, (f"%{query_lower}%", f"%{query_lower}%"))
-                income_rows = cursor.fetchall()
-                
-                for row in income_rows:
-                    income = IncomeEntry(
-                        id=row[0],
-                        date=row[1],
-                        source=row[2],
-                        amount=row[3],
-                        description=row[4] or "",
-                        alias=row[5] or None
-                    )
-                    matching_income.append(income)
-                
-                # Search expenses
-                cursor.execute(f"""
-                    SELECT * FROM expenses 
-                    WHERE {NOT} (LOWER(category) LIKE ? OR LOWER(description) LIKE ?)
-                    ORDER BY date ASC
-                """, (f"%{query_lower}%", f"%{query_lower}%"))
-                expense_rows = cursor.fetchall()
-                
-                for row in expense_rows:
-                    expense = ExpenseEntry(
-                        id=row[0],
-                        date=row[1],
-                        category=row[2],
-                        amount=row[3],
-                        description=row[4] or "",
-                        alias=row[5] or None
-                    )
-                    matching_expenses.append(expense)
-                    
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
+        for kind, entry in self.iter_search_entries(query, exclude=exclude):
+            if kind == 'income':
+                add_income(entry)
+            else:
+                add_expense(entry)
         
         return matching_income, matching_expenses
 
+    def iter_search_entries(self, query: str, exclude: bool = False,
+                            batch_size: int = 500) -> Iterator[Tuple[str, Union[IncomeEntry, ExpenseEntry]]]:
+        """
+        Lazily yield the income and expense entries matching a search, newest first.
+
+        Args:
+            query: Text to look for in the source/category or description
+            exclude: Yield the entries that do not contain the text instead
+            batch_size: Number of rows fetched per batch
+
+        Yields:
+            Tuple[str, Union[IncomeEntry, ExpenseEntry]]: 'income' or 'expenses', and the matching entry
+        """
+        # SQLite's LIKE already ignores ASCII case, so the columns are matched as
+        # stored rather than lowercasing every row before comparing.
+        pattern = f"%{query}%"
+        sql = _SQL_SEARCH_EXCLUDE if exclude else _SQL_SEARCH
+        yield from self._iter_entries(_search_result_from_row, sql,
+                                      (pattern, pattern, pattern, pattern), batch_size)
 
 # TODO: Add multi-month comparison charts for spending trends
 # TODO: Add category heatmaps in reports
@@ -6,13 +6,100 @@ This module handles savings goals, progress tracking, and goal management.
 
 import sqlite3
 import os
-from datetime import datetime, date, timedelta
+import threading
+from datetime import date, timedelta
+from operator import attrgetter, itemgetter
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
 from better_budget_tracker.utils import validate_amount, validate_date, format_currency, get_current_date_string
 
+# SQL for the hot paths. Each statement lives in one constant, so every call hands
+# sqlite3 the same string and reuses the prepared statement from the connection's
+# statement cache instead of re-parsing it.
+_SQL_ADD_GOAL = """
+    INSERT INTO savings_goals 
+    (name, target_amount, current_amount, target_date, category, description, is_completed, created_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_ALL_GOALS = "SELECT * FROM savings_goals ORDER BY target_date ASC, created_at DESC"
+_SQL_GOAL_BY_ID = "SELECT * FROM savings_goals WHERE id = ?"
+_SQL_UPDATE_GOAL = """
+    UPDATE savings_goals 
+    SET name = ?, target_amount = ?, current_amount = ?, 
+        target_date = ?, category = ?, description = ?, is_completed = ?
+    WHERE id = ?
+"""
+_SQL_DELETE_GOAL = "DELETE FROM savings_goals WHERE id = ?"
+_SQL_GOALS_BY_CATEGORY = "SELECT * FROM savings_goals WHERE category = ? ORDER BY target_date ASC"
+# Date filters compare ISO date strings directly, which sorts the same as the dates
+# themselves and lets SQLite use idx_goals_target_date.
+_SQL_OVERDUE_GOALS = """
+    SELECT * FROM savings_goals
+    WHERE target_date < ? AND NOT is_completed
+    ORDER BY target_date ASC, created_at DESC
+"""
+_SQL_GOALS_DUE_BY = """
+    SELECT * FROM savings_goals
+    WHERE target_date <= ? AND NOT is_completed
+    ORDER BY target_date ASC, created_at DESC
+"""
+_SQL_GOAL_ARRAYS = """
+    SELECT id, name, category, target_amount, current_amount, is_completed, target_date
+    FROM savings_goals ORDER BY target_date ASC, created_at DESC
+"""
+_SQL_GOALS_SUMMARY = """
+    SELECT
+        COUNT(*),
+        COALESCE(SUM(is_completed), 0),
+        COALESCE(SUM(CASE WHEN NOT is_completed AND target_date < ? THEN 1 ELSE 0 END), 0),
+        COALESCE(SUM(target_amount), 0.0),
+        COALESCE(SUM(current_amount), 0.0),
+        COALESCE(SUM(CASE WHEN is_completed THEN 0.0
+                          ELSE MAX(target_amount - current_amount, 0.0) END), 0.0)
+    FROM savings_goals
+"""
+_SQL_GOALS_BY_CATEGORY_SUMMARY = """
+    SELECT
+        category,
+        COUNT(*),
+        SUM(is_completed),
+        SUM(target_amount),
+        SUM(current_amount),
+        SUM(CASE WHEN is_completed THEN 0.0
+                 ELSE MAX(target_amount - current_amount, 0.0) END)
+    FROM savings_goals
+    GROUP BY category
+"""
+_SQL_SEARCH_GOALS_FTS = """
+    SELECT * FROM savings_goals
+    WHERE id IN (SELECT rowid FROM goals_fts WHERE goals_fts MATCH ?)
+    ORDER BY target_date ASC
+"""
+_SQL_SEARCH_GOALS_LIKE = """
+    SELECT * FROM savings_goals
+    WHERE name LIKE ? OR category LIKE ? OR description LIKE ?
+    ORDER BY target_date ASC
+"""
+
+
+@lru_cache(maxsize=1024)
+def _parse_target_date(target_date: str) -> Optional[date]:
+    """
+    Parse a goal's target date, or return None if it is not a valid date.
+
+    Cached on the string itself, so a date is parsed once however many goals share
+    it, and a goal whose target_date is reassigned picks up the new date.
+    """
+    try:
+        return date.fromisoformat(target_date)
+    except ValueError:
+        return None
 
-@dataclass
+
+@dataclass(slots=True)
 class SavingsGoal:
     """Data class representing a savings goal."""
     id: Optional[int] = None
@@ -38,6 +125,21 @@ class SavingsGoal:
         if not validate_date(self.created_date):
             raise ValueError("Invalid created date format")
 
+    @classmethod
+    def from_row_unchecked(cls, row: tuple) -> "SavingsGoal":
+        """Build a goal from a savings_goals table row, skipping validation."""
+        goal = object.__new__(cls)
+        goal.id = row[0]
+        goal.name = row[1]
+        goal.target_amount = row[2]
+        goal.current_amount = row[3]
+        goal.target_date = row[4]
+        goal.category = row[5]
+        goal.description = row[6] or ""
+        goal.is_completed = bool(row[7])
+        goal.created_date = row[8]
+        return goal
+
     @property
     def progress_percentage(self) -> float:
         """Calculate progress percentage."""
@@ -50,24 +152,36 @@ class SavingsGoal:
         """Calculate remaining amount to reach goal."""
         return max(self.target_amount - self.current_amount, 0.0)
 
+    @property
+    def target_date_obj(self) -> Optional[date]:
+        """Target date as a date, or None if the stored target_date is not a valid date."""
+        return _parse_target_date(self.target_date)
+
     @property
     def days_remaining(self) -> int:
         """Calculate days remaining until target date."""
-        try:
-            target = datetime.strptime(self.target_date, '%Y-%m-%d').date()
-            today = date.today()
-            return max((target - today).days, 0)
-        except ValueError:
-            return 0
+        return self.days_remaining_on(date.today())
 
     @property
     def is_overdue(self) -> bool:
         """Check if goal is overdue."""
-        try:
-            target = datetime.strptime(self.target_date, '%Y-%m-%d').date()
-            return date.today() > target and not self.is_completed
-        except ValueError:
+        return self.is_overdue_on(date.today())
+
+    # The *_on variants take the current date from the caller, so a loop over many
+    # goals can look it up once instead of once per goal.
+    def days_remaining_on(self, today: date) -> int:
+        """Calculate days remaining until target date, as seen on the given day."""
+        target = _parse_target_date(self.target_date)
+        if target is None:
+            return 0
+        return max((target - today).days, 0)
+
+    def is_overdue_on(self, today: date) -> bool:
+        """Check if goal is overdue on the given day."""
+        target = _parse_target_date(self.target_date)
+        if target is None:
             return False
+        return today > target and not self.is_completed
 
 
 class GoalTracker:
@@ -77,16 +191,31 @@ class GoalTracker:
         """Initialize the goal tracker with database path."""
         self.db_path = db_path
         self._ensure_data_directory()
+        # A single long-lived connection shared by every method. It runs in
+        # autocommit mode; multi-statement operations open their own transaction.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=256)
+        self._lock = threading.Lock()
         self._init_database()
     
     def _ensure_data_directory(self) -> None:
         """Ensure the data directory exists."""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
     
     def _init_database(self) -> None:
         """Initialize the SQLite database with goals table."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self._lock:
+            cursor = self._conn.cursor()
+            # journal_mode is stored in the database file; synchronous applies to
+            # this connection, which is kept open for the tracker's lifetime.
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA cache_size=-32000")
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS savings_goals (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -101,7 +230,59 @@ class GoalTracker:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            conn.commit()
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_goals_category ON savings_goals(category)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_goals_completed ON savings_goals(is_completed)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_goals_target_date ON savings_goals(target_date)")
+            self._has_fts = self._init_search_index(cursor)
+    
+    @staticmethod
+    def _init_search_index(cursor: sqlite3.Cursor) -> bool:
+        """
+        Create the full-text index used by search_goals, kept in sync by triggers.
+        
+        The trigram tokenizer indexes every three-character run, so a MATCH finds
+        the same case-insensitive substrings as the LIKE search it replaces.
+        
+        Returns:
+            bool: False if this SQLite build has no FTS5 trigram support
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'goals_fts'")
+        exists = cursor.fetchone() is not None
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS goals_fts USING fts5(
+                    name, category, description,
+                    content='savings_goals', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+        
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS goals_fts_insert AFTER INSERT ON savings_goals BEGIN
+                INSERT INTO goals_fts (rowid, name, category, description)
+                VALUES (new.id, new.name, new.category, new.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS goals_fts_delete AFTER DELETE ON savings_goals BEGIN
+                INSERT INTO goals_fts (goals_fts, rowid, name, category, description)
+                VALUES ('delete', old.id, old.name, old.category, old.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS goals_fts_update AFTER UPDATE OF name, category, description
+            ON savings_goals BEGIN
+                INSERT INTO goals_fts (goals_fts, rowid, name, category, description)
+                VALUES ('delete', old.id, old.name, old.category, old.description);
+                INSERT INTO goals_fts (rowid, name, category, description)
+                VALUES (new.id, new.name, new.category, new.description);
+            END
+        """)
+        if not exists:
+            # Index goals saved before the search index existed
+            cursor.execute("INSERT INTO goals_fts (goals_fts) VALUES ('rebuild')")
+        return True
     
     def add_goal(self, goal: SavingsGoal) -> int:
         """
@@ -114,13 +295,9 @@ class GoalTracker:
             int: ID of the created goal
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT INTO savings_goals 
-                    (name, target_amount, current_amount, target_date, category, description, is_completed, created_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_ADD_GOAL, (
                     goal.name,
                     goal.target_amount,
                     goal.current_amount,
@@ -130,58 +307,76 @@ class GoalTracker:
                     goal.is_completed,
                     goal.created_date
                 ))
-                conn.commit()
                 return cursor.lastrowid
         except sqlite3.Error as e:
             raise ValueError(f"Database error: {e}")
     
+    def add_goals_bulk(self, goals: List[SavingsGoal]) -> int:
+        """
+        Add many savings goals in a single transaction.
+        
+        Args:
+            goals: SavingsGoal objects to add
+            
+        Returns:
+            int: Number of goals added
+        """
+        rows = [(goal.name, goal.target_amount, goal.current_amount, goal.target_date,
+                 goal.category, goal.description, goal.is_completed, goal.created_date)
+                for goal in goals]
+        try:
+            with self._lock, self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                cursor = self._conn.executemany(_SQL_ADD_GOAL, rows)
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            raise ValueError(f"Database error: {e}")
+    
     def get_all_goals(self) -> List[SavingsGoal]:
         """Get all savings goals."""
-        goals = []
+        return self._select_goals(_SQL_ALL_GOALS)
+    
+    def load_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Load all goals as parallel column arrays for vectorized analytics.
+        
+        Returns:
+            Dict with 'ids', 'names', 'categories', 'target_amounts',
+            'current_amounts', 'is_completed' and 'target_dates' (datetime64[D])
+            arrays, ordered like get_all_goals.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM savings_goals ORDER BY target_date ASC, created_at DESC")
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_GOAL_ARRAYS)
                 rows = cursor.fetchall()
-                
-                for row in rows:
-                    goal = SavingsGoal(
-                        id=row[0],
-                        name=row[1],
-                        target_amount=row[2],
-                        current_amount=row[3],
-                        target_date=row[4],
-                        category=row[5],
-                        description=row[6] or "",
-                        is_completed=bool(row[7]),
-                        created_date=row[8]
-                    )
-                    goals.append(goal)
         except sqlite3.Error as e:
             print(f"Database error: {e}")
+            rows = []
         
-        return goals
+        ids, names, categories, target_amounts, current_amounts, is_completed, target_dates = (
+            zip(*rows) if rows else ((),) * 7
+        )
+        return {
+            'ids': np.array(ids, dtype=np.int64),
+            'names': np.array(names, dtype=object),
+            'categories': np.array(categories, dtype=object),
+            'target_amounts': np.array(target_amounts, dtype=np.float64),
+            'current_amounts': np.array(current_amounts, dtype=np.float64),
+            'is_completed': np.array(is_completed, dtype=bool),
+            'target_dates': np.array(target_dates, dtype='datetime64[D]'),
+        }
     
     def get_goal_by_id(self, goal_id: int) -> Optional[SavingsGoal]:
         """Get a specific goal by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM savings_goals WHERE id = ?", (goal_id,))
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_GOAL_BY_ID, (goal_id,))
                 row = cursor.fetchone()
                 
                 if row:
-                    return SavingsGoal(
-                        id=row[0],
-                        name=row[1],
-                        target_amount=row[2],
-                        current_amount=row[3],
-                        target_date=row[4],
-                        category=row[5],
-                        description=row[6] or "",
-                        is_completed=bool(row[7]),
-                        created_date=row[8]
-                    )
+                    return SavingsGoal.from_row_unchecked(row)
         except sqlite3.Error as e:
             print(f"Database error: {e}")
         
@@ -201,14 +396,9 @@ class GoalTracker:
             raise ValueError("Goal ID is required for update")
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    UPDATE savings_goals 
-                    SET name = ?, target_amount = ?, current_amount = ?, 
-                        target_date = ?, category = ?, description = ?, is_completed = ?
-                    WHERE id = ?
-                """, (
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_UPDATE_GOAL, (
                     goal.name,
                     goal.target_amount,
                     goal.current_amount,
@@ -218,7 +408,6 @@ class GoalTracker:
                     goal.is_completed,
                     goal.id
                 ))
-                conn.commit()
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             print(f"Database error: {e}")
@@ -227,10 +416,9 @@ class GoalTracker:
     def delete_goal(self, goal_id: int) -> bool:
         """Delete a goal by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM savings_goals WHERE id = ?", (goal_id,))
-                conn.commit()
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_DELETE_GOAL, (goal_id,))
                 return cursor.rowcount > 0
         except sqlite3.Error as e:
             print(f"Database error: {e}")
@@ -247,74 +435,150 @@ class GoalTracker:
         Returns:
             bool: True if successful
         """
-        if amount <= 0:
-            raise ValueError("Progress amount must be positive")
-        
-        goal = self.get_goal_by_id(goal_id)
-        if not goal:
-            raise ValueError("Goal not found")
+        return self.add_progress_bulk({goal_id: amount}) > 0
+    
+    def add_progress_bulk(self, updates: Dict[int, float]) -> int:
+        """
+        Add progress to many goals in a single transaction.
         
-        goal.current_amount += amount
+        The goals are read with one IN query and written back with one UPDATE
+        per batch of ids, instead of a read and a write per goal.
         
-        # Check if goal is completed
-        if goal.current_amount >= goal.target_amount:
-            goal.is_completed = True
-            goal.current_amount = goal.target_amount  # Cap at target amount
+        Args:
+            updates: Mapping of goal ID to the amount to add to its progress
+            
+        Returns:
+            int: Number of goals updated
+            
+        Raises:
+            ValueError: If an amount is not positive, a goal does not exist, or a
+                database error occurs
+        """
+        if any(amount <= 0 for amount in updates.values()):
+            raise ValueError("Progress amount must be positive")
         
-        return self.update_goal(goal)
+        goal_ids = list(updates)
+        updated = 0
+        try:
+            with self._lock, self._conn:
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                # Batched to stay well under SQLite's bound-parameter limit
+                for start in range(0, len(goal_ids), 500):
+                    batch = goal_ids[start:start + 500]
+                    placeholders = ", ".join("?" * len(batch))
+                    cursor.execute(f"""
+                        SELECT id, current_amount, target_amount, is_completed
+                        FROM savings_goals WHERE id IN ({placeholders})
+                    """, batch)
+                    rows = cursor.fetchall()
+                    if len(rows) != len(batch):
+                        raise ValueError("Goal not found")
+                    
+                    new_amounts = []
+                    new_completed = []
+                    for goal_id, current_amount, target_amount, is_completed in rows:
+                        current_amount += updates[goal_id]
+                        # Check if goal is completed
+                        if current_amount >= target_amount:
+                            is_completed = True
+                            current_amount = target_amount  # Cap at target amount
+                        new_amounts += (goal_id, current_amount)
+                        new_completed += (goal_id, bool(is_completed))
+                    
+                    cases = " ".join(["WHEN ? THEN ?"] * len(rows))
+                    cursor.execute(f"""
+                        UPDATE savings_goals
+                        SET current_amount = CASE id {cases} END,
+                            is_completed = CASE id {cases} END
+                        WHERE id IN ({placeholders})
+                    """, new_amounts + new_completed + batch)
+                    updated += cursor.rowcount
+                return updated
+        except sqlite3.Error as e:
+            raise ValueError(f"Database error: {e}")
     
     def get_goals_by_category(self, category: str) -> List[SavingsGoal]:
         """Get all goals in a specific category."""
+        return self._select_goals(_SQL_GOALS_BY_CATEGORY, (category,))
+    
+    def _select_goals(self, sql: str, params: tuple = ()) -> List[SavingsGoal]:
+        """Run a savings_goals query and build a goal from every row."""
         goals = []
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM savings_goals WHERE category = ? ORDER BY target_date ASC", (category,))
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    goal = SavingsGoal(
-                        id=row[0],
-                        name=row[1],
-                        target_amount=row[2],
-                        current_amount=row[3],
-                        target_date=row[4],
-                        category=row[5],
-                        description=row[6] or "",
-                        is_completed=bool(row[7]),
-                        created_date=row[8]
-                    )
-                    goals.append(goal)
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(sql, params)
+                goals = list(map(SavingsGoal.from_row_unchecked, cursor))
         except sqlite3.Error as e:
             print(f"Database error: {e}")
         
         return goals
     
-    def get_active_goals(self) -> List[SavingsGoal]:
+    # The goal filters below accept an already-fetched list of goals, so callers
+    # that need several of them can load the goals once and share the list.
+    def get_active_goals(self, goals: Optional[List[SavingsGoal]] = None) -> List[SavingsGoal]:
         """Get all active (non-completed) goals."""
-        all_goals = self.get_all_goals()
+        all_goals = self.get_all_goals() if goals is None else goals
         return [goal for goal in all_goals if not goal.is_completed]
     
-    def get_completed_goals(self) -> List[SavingsGoal]:
+    def get_completed_goals(self, goals: Optional[List[SavingsGoal]] = None) -> List[SavingsGoal]:
         """Get all completed goals."""
-        all_goals = self.get_all_goals()
+        all_goals = self.get_all_goals() if goals is None else goals
         return [goal for goal in all_goals if goal.is_completed]
     
-    def get_overdue_goals(self) -> List[SavingsGoal]:
+    def get_overdue_goals(self, goals: Optional[List[SavingsGoal]] = None) -> List[SavingsGoal]:
         """Get all overdue goals."""
-        all_goals = self.get_all_goals()
-        return [goal for goal in all_goals if goal.is_overdue]
+        if goals is None:
+            return self._select_goals(_SQL_OVERDUE_GOALS, (date.today().isoformat(),))
+        today = date.today()
+        return [goal for goal in goals if goal.is_overdue_on(today)]
     
-    def get_goals_summary(self) -> Dict[str, any]:
-        """Get summary statistics for all goals."""
-        all_goals = self.get_all_goals()
-        active_goals = self.get_active_goals()
-        completed_goals = self.get_completed_goals()
-        overdue_goals = self.get_overdue_goals()
+    def get_goals_summary(self, goals: Optional[List[SavingsGoal]] = None) -> Dict[str, any]:
+        """
+        Get summary statistics for all goals.
         
-        total_target_amount = sum(goal.target_amount for goal in all_goals)
-        total_current_amount = sum(goal.current_amount for goal in all_goals)
-        total_remaining = sum(goal.remaining_amount for goal in active_goals)
+        Args:
+            goals: Goals to summarize. If omitted, the totals are computed by the
+                database without loading individual goals.
+            
+        Returns:
+            Dict with goal counts, totals and overall progress
+        """
+        if goals is not None:
+            return self._summarize_goals(goals)
+        
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_GOALS_SUMMARY, (date.today().isoformat(),))
+                row = cursor.fetchone()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return self._summarize_goals([])
+        
+        total_goals, completed_goals, overdue_goals, total_target_amount, total_current_amount, total_remaining = row
+        
+        return {
+            'total_goals': total_goals,
+            'active_goals': total_goals - completed_goals,
+            'completed_goals': completed_goals,
+            'overdue_goals': overdue_goals,
+            'total_target_amount': total_target_amount,
+            'total_current_amount': total_current_amount,
+            'total_remaining': total_remaining,
+            'overall_progress': (total_current_amount / total_target_amount * 100) if total_target_amount > 0 else 0
+        }
+    
+    def _summarize_goals(self, all_goals: List[SavingsGoal]) -> Dict[str, any]:
+        """Compute get_goals_summary statistics from an already-fetched list of goals."""
+        active_goals = self.get_active_goals(all_goals)
+        completed_goals = self.get_completed_goals(all_goals)
+        overdue_goals = self.get_overdue_goals(all_goals)
+        
+        total_target_amount = sum(map(attrgetter('target_amount'), all_goals))
+        total_current_amount = sum(map(attrgetter('current_amount'), all_goals))
+        total_remaining = sum(map(attrgetter('remaining_amount'), active_goals))
         
         return {
             'total_goals': len(all_goals),
@@ -329,83 +593,67 @@ class GoalTracker:
     
     def get_category_summary(self) -> Dict[str, Dict[str, float]]:
         """Get summary statistics by category."""
-        all_goals = self.get_all_goals()
         category_data = {}
         
-        for goal in all_goals:
-            if goal.category not in category_data:
-                category_data[goal.category] = {
-                    'total_goals': 0,
-                    'active_goals': 0,
-                    'completed_goals': 0,
-                    'total_target': 0.0,
-                    'total_current': 0.0,
-                    'total_remaining': 0.0
-                }
-            
-            category_data[goal.category]['total_goals'] += 1
-            category_data[goal.category]['total_target'] += goal.target_amount
-            category_data[goal.category]['total_current'] += goal.current_amount
-            
-            if goal.is_completed:
-                category_data[goal.category]['completed_goals'] += 1
-            else:
-                category_data[goal.category]['active_goals'] += 1
-                category_data[goal.category]['total_remaining'] += goal.remaining_amount
+        try:
+            with self._lock:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_GOALS_BY_CATEGORY_SUMMARY)
+                rows = cursor.fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return category_data
         
-        # Calculate percentages
-        for category in category_data:
-            data = category_data[category]
-            if data['total_target'] > 0:
-                data['progress_percentage'] = (data['total_current'] / data['total_target']) * 100
-            else:
-                data['progress_percentage'] = 0.0
+        for category, total_goals, completed_goals, total_target, total_current, total_remaining in rows:
+            category_data[category] = {
+                'total_goals': total_goals,
+                'active_goals': total_goals - completed_goals,
+                'completed_goals': completed_goals,
+                'total_target': total_target,
+                'total_current': total_current,
+                'total_remaining': total_remaining,
+                'progress_percentage': (total_current / total_target) * 100 if total_target > 0 else 0.0
+            }
         
         return category_data
     
     def search_goals(self, query: str) -> List[SavingsGoal]:
         """Search goals by name, category, or description."""
-        query_lower = query.lower()
         matching_goals = []
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT * FROM savings_goals 
-                    WHERE LOWER(name) LIKE ? OR LOWER(category) LIKE ? OR LOWER(description) LIKE ?
-                    ORDER BY target_date ASC
-                """, (f"%{query_lower}%", f"%{query_lower}%", f"%{query_lower}%"))
-                rows = cursor.fetchall()
-                
-                for row in rows:
-                    goal = SavingsGoal(
-                        id=row[0],
-                        name=row[1],
-                        target_amount=row[2],
-                        current_amount=row[3],
-                        target_date=row[4],
-                        category=row[5],
-                        description=row[6] or "",
-                        is_completed=bool(row[7]),
-                        created_date=row[8]
-                    )
-                    matching_goals.append(goal)
+            with self._lock:
+                cursor = self._conn.cursor()
+                # Trigrams need at least three characters; shorter queries scan with LIKE
+                if self._has_fts and len(query) >= 3:
+                    cursor.execute(_SQL_SEARCH_GOALS_FTS, ('"' + query.replace('"', '""') + '"',))
+                else:
+                    pattern = f"%{query}%"
+                    cursor.execute(_SQL_SEARCH_GOALS_LIKE, (pattern, pattern, pattern))
+                matching_goals = list(map(SavingsGoal.from_row_unchecked, cursor))
         except sqlite3.Error as e:
             print(f"Database error: {e}")
         
         return matching_goals
     
-    def get_goals_due_soon(self, days: int = 30) -> List[SavingsGoal]:
+    def get_goals_due_soon(self, days: int = 30, goals: Optional[List[SavingsGoal]] = None) -> List[SavingsGoal]:
         """Get goals that are due within the specified number of days."""
-        all_goals = self.get_active_goals()
+        if goals is None:
+            # Overdue goals count as due now, matching days_remaining's floor of 0
+            due_by = date.today() + timedelta(days=days)
+            return self._select_goals(_SQL_GOALS_DUE_BY, (due_by.isoformat(),))
+        
+        all_goals = self.get_active_goals(goals)
+        today = date.today()
         due_soon = []
         
         for goal in all_goals:
-            if goal.days_remaining <= days:
-                due_soon.append(goal)
+            days_remaining = goal.days_remaining_on(today)
+            if days_remaining <= days:
+                due_soon.append((days_remaining, goal))
         
-        return sorted(due_soon, key=lambda g: g.days_remaining)
+        due_soon.sort(key=itemgetter(0))
+        return [goal for _, goal in due_soon]
     
     def get_goals_progress_trend(self, goal_id: int, months: int = 6) -> List[Dict[str, any]]:
         """
@@ -416,23 +664,24 @@ class GoalTracker:
         if not goal:
             return []
         
-        # For demo purposes, create mock progress data
-        trend_data = []
-        current_date = date.today()
-        
-        for i in range(months):
-            month_date = current_date - timedelta(days=30 * i)
-            # Mock progress calculation (in real app, this would come from historical data)
-            progress_amount = goal.current_amount * (1 - (i * 0.1))  # Decreasing progress going back in time
-            progress_amount = max(progress_amount, 0)
-            
-            trend_data.append({
-                'date': month_date.strftime('%Y-%m-%d'),
-                'amount': progress_amount,
-                'percentage': (progress_amount / goal.target_amount * 100) if goal.target_amount > 0 else 0
-            })
+        # For demo purposes, create mock progress data, computed for all months at once.
+        # Index i is i months (of 30 days) back from today.
+        months_back = np.arange(months)
+        month_dates = np.datetime64(date.today()) - (months_back * 30).astype('timedelta64[D]')
+        # Mock progress calculation (in real app, this would come from historical data)
+        progress_amounts = np.maximum(goal.current_amount * (1 - months_back * 0.1), 0)  # Decreasing going back in time
+        if goal.target_amount > 0:
+            percentages = progress_amounts / goal.target_amount * 100
+        else:
+            percentages = np.zeros_like(progress_amounts)
         
-        return list(reversed(trend_data))  # Return in chronological order
+        # Return in chronological order
+        return [
+            {'date': str(month_date), 'amount': amount, 'percentage': percentage}
+            for month_date, amount, percentage in zip(
+                month_dates[::-1], progress_amounts[::-1].tolist(), percentages[::-1].tolist()
+            )
+        ]
 
 
 # TODO: Add multi-month comparison charts for spending trends
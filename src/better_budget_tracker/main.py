@@ -8,46 +8,203 @@ It provides a command-line interface for managing budgets, expenses, income, and
 
 import sys
 import os
+import argparse
 import shutil
+from io import StringIO
 from typing import TypeVar, Callable
+from contextlib import contextmanager
+from functools import cached_property
 from datetime import datetime, date
 
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
+from rich.style import Style
+from rich.segment import Segment, Segments
+from rich.cells import cell_len
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import box
-from sympy.strategies.core import switch
-from urllib3.filepost import choose_boundary
 
 from better_budget_tracker.budget import BudgetManager, IncomeEntry, ExpenseEntry, BudgetLimit, AliasEntry
 from better_budget_tracker.goal_tracker import GoalTracker, SavingsGoal
-from better_budget_tracker.reports import ReportGenerator
 from better_budget_tracker.utils import (
     validate_amount, validate_date, validate_category, validate_description, validate_alias,
     parse_amount, parse_id,
-    format_currency, format_date, format_percentage,
+    format_currency, format_percentage, truncate_string,
     get_common_expense_categories, get_common_income_sources, get_common_goal_categories,
     get_current_date_string, get_month_start_date, get_month_end_date, parse_date,
     Category_invalid_characters, Alias_invalid_characters
 )
 from better_budget_tracker.config_manager import (ConfigManager)
 
+# Column specs of the listing tables: (header, style, justify, no_wrap)
+INCOME_COLUMNS = (
+    ("ID", "cyan", "left", True),
+    ("Date", "white", "left", False),
+    ("Source", "green", "left", False),
+    ("Amount", "green", "right", False),
+    ("Description", "white", "left", False),
+)
+EXPENSE_COLUMNS = (
+    ("ID", "cyan", "left", True),
+    ("Date", "white", "left", False),
+    ("Category", "red", "left", False),
+    ("Amount", "red", "right", False),
+    ("Description", "white", "left", False),
+)
+BUDGET_STATUS_COLUMNS = (
+    ("Category", "cyan", "left", False),
+    ("Limit", "white", "right", False),
+    ("Spent", "red", "right", False),
+    ("Remaining", "green", "right", False),
+    ("Status", "white", "left", False),
+)
+BUDGET_LIMIT_COLUMNS = (
+    ("Category", "cyan", "left", False),
+    ("Monthly Limit", "white", "right", False),
+    ("Description", "white", "left", False),
+)
+GOAL_COLUMNS = (
+    ("ID", "cyan", "left", True),
+    ("Name", "white", "left", False),
+    ("Category", "yellow", "left", False),
+    ("Progress", "green", "right", False),
+    ("Target Date", "white", "left", False),
+    ("Status", "white", "left", False),
+)
+ALIAS_COLUMNS = (
+    ("ID", "cyan", "left", True),
+    ("Alias", "dark_orange", "left", False),
+    ("Full Name", "yellow", "left", False),
+    ("Type", "white", "left", False),
+)
+
+SEARCH_INCOME_COLUMNS = (
+    ("Date", "white", "left", False),
+    ("Source", "green", "left", False),
+    ("Amount", "green", "right", False),
+    ("Description", "white", "left", False),
+)
+SEARCH_EXPENSE_COLUMNS = (
+    ("Date", "white", "left", False),
+    ("Category", "red", "left", False),
+    ("Amount", "red", "right", False),
+    ("Description", "white", "left", False),
+)
+
+# Goal status icons, indexed by is_completed << 1 | is_overdue
+_GOAL_ICONS = ("🟡", "🔴", "✅", "✅")
+
+# Body of the monthly summary panel; only the figures change between views.
+# Amounts are formatted as format_currency does, without a call per figure.
+_MONTHLY_SUMMARY_TEMPLATE = """
+        Month: {month}
+        
+        Total Income: ${income:,.2f}
+        Total Expenses: ${expenses:,.2f}
+        Net Income: ${net:,.2f}
+        Savings Rate: {rate:.1f}%
+        """
+
+
+def _make_table(title, header_style: str, columns, widths=None, show_header: bool = True) -> Table:
+    """
+    Build an empty table from a column spec.
+
+    Args:
+        title: Table title, or None for no title
+        header_style: Style of the header row
+        columns: (header, style, justify, no_wrap) of each column
+        widths: Fixed width of each column. Fixed-width columns never wrap.
+        show_header: Whether to show the header row
+
+    Returns:
+        Table: Table with its columns added and no rows
+    """
+    table = Table(title=title, show_header=show_header, header_style=header_style)
+    if widths is None:
+        for header, style, justify, no_wrap in columns:
+            table.add_column(header, style=style, justify=justify, no_wrap=no_wrap)
+    else:
+        for (header, style, justify, _), width in zip(columns, widths):
+            table.add_column(header, style=style, justify=justify, width=width, no_wrap=True)
+    return table
+
 
 class BudgetTrackerCLI:
     """Command-line interface for the budget tracker."""
     
-    def __init__(self):
-        """Initialize the CLI application."""
+    # Long listings are shown this many rows at a time
+    PAGE_SIZE = 50
+    # Search results longer than this are written as plain fixed-width text instead of a Rich table
+    FAST_TABLE_THRESHOLD = 50
+    
+    def __init__(self, rich_tables: bool = True):
+        """
+        Initialize the CLI application.
+
+        Args:
+            rich_tables: Draw short search results as Rich tables; False always prints plain text
+        """
         self.console = Console()
+        # Output going to a pipe or file gets plain text instead of Rich tables and panels
+        self._is_tty = self.console.is_terminal
+        self.rich_tables = rich_tables
         self.config_manager = ConfigManager()
         self.budget_manager = BudgetManager(db_path=self.config_manager.config.db_file) #Pass config manager's db filepath in
         self.goal_tracker = GoalTracker(db_path=self.config_manager.config.db_file) #Pass config manager's db filepath in
-        self.report_generator = ReportGenerator(self.budget_manager,
-                                                self.goal_tracker,
-                                                self.config_manager.config.reports_dir)
         self.running = True
+        # The suggested categories never change, so their prompt text is built once
+        self._common_expense_categories_text = ", ".join(get_common_expense_categories())
+        self._common_goal_categories_text = ", ".join(get_common_goal_categories())
+        self._main_menu_table = self._build_main_menu_table()
+        # Main menu choice -> handler
+        self._menu_dispatch = {
+            "1": self.income_management_menu,
+            "2": self.expense_management_menu,
+            "3": self.search_menu,
+            "4": self.budget_management_menu,
+            "5": self.savings_goals_menu,
+            "6": self.reports_menu,
+            "7": self.advanced_options_menu,
+            "8": self._quit,
+        }
+
+    @cached_property
+    def report_generator(self):
+        """Report generator, created the first time a report is requested."""
+        # Reports pull in matplotlib, which most sessions never need
+        from better_budget_tracker.reports import ReportGenerator
+        return ReportGenerator(self.budget_manager,
+                               self.goal_tracker,
+                               self.config_manager.config.reports_dir)
+
+    @cached_property
+    def _progress(self):
+        """Spinner shown while a report is generated, shared by all report actions."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        return Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"),
+                        console=self.console)
+
+    @contextmanager
+    def _spinner(self, description: str):
+        """
+        Show the shared spinner with the given description while the block runs.
+
+        The spinner is stopped again afterwards so it does not draw over the menu prompts.
+
+        Args:
+            description: Text shown next to the spinner
+        """
+        progress = self._progress
+        task = progress.add_task(description, total=None)
+        progress.start()
+        try:
+            yield
+        finally:
+            progress.stop()
+            progress.remove_task(task)
 
     def display_welcome(self, extra="") -> None:
         """Display welcome message and main menu."""
@@ -62,6 +219,11 @@ class BudgetTrackerCLI:
 
     def display_main_menu(self) -> None:
         """Display the main menu options."""
+        self.console.print(self._main_menu_table)
+
+    @staticmethod
+    def _build_main_menu_table() -> Table:
+        """Build the main menu table. Its content never changes, so it is built once."""
         menu_options = [
             "💰 Income Management",
             "💸 Expense Management",
@@ -91,18 +253,51 @@ class BudgetTrackerCLI:
         for i, (option, desc) in enumerate(zip(menu_options, descriptions), 1):
             table.add_row(f"{i}", f"{option} - {desc}")
         
-        self.console.print(table)
+        return table
     
     def get_user_choice(self) -> str:
         """Get user's menu choice."""
         while True:
             try:
-                choice = Prompt.ask("Enter your choice", choices=["1", "2", "3", "4", "5", "6", "7", "8"])
+                choice = self._ask_digit("Enter your choice", "12345678")
                 return choice
             except KeyboardInterrupt:
                 self.console.print("\n[yellow]Exiting...[/yellow]")
                 sys.exit(0)
 
+    def _ask_digit(self, prompt: str, valid: str) -> str:
+        """
+        Ask for a single-digit menu choice until one of the valid digits is entered.
+
+        Args:
+            prompt: Prompt text
+            valid: Accepted digits, e.g. "1234"
+
+        Returns:
+            str: The chosen digit
+        """
+        prompt_text = f"{prompt} [{'/'.join(valid)}]: "
+        while True:
+            choice = input(prompt_text).strip()
+            if len(choice) == 1 and choice in valid:
+                return choice
+            self.console.print("[red]Please select one of the available options[/red]")
+
+    def _raw_input(self, label: str, default: str = "") -> str:
+        """
+        Read one line for a prompt with a default, without going through Rich's Prompt.
+
+        Args:
+            label: Prompt text
+            default: Value returned when the user just presses Enter
+
+        Returns:
+            str: The entered text, or the default
+        """
+        self.console.file.write(f"{label} ({default}): " if default else f"{label}: ")
+        self.console.file.flush()
+        return input() or default
+
     TParseReturnType = TypeVar("TParseReturnType")
 
     def get_parsed_input(self, prompt: str,
@@ -110,7 +305,8 @@ class BudgetTrackerCLI:
                          default=None) -> TParseReturnType:
         """Get user input and parse with provided function"""
         while True:
-            user_input = Prompt.ask(prompt, default=default)
+            user_input = (Prompt.ask(prompt) if default is None
+                          else self._raw_input(prompt, default))
             if parse is not None:
                 try:
                     return parse(user_input)
@@ -122,7 +318,8 @@ class BudgetTrackerCLI:
                             default=None) -> str:
         """Get user input and validate with provided function"""
         while True:
-            user_input = Prompt.ask(prompt, default=default)
+            user_input = (Prompt.ask(prompt) if default is None
+                          else self._raw_input(prompt, default))
             if validate is not None:
                 if not validate(user_input):
                     self.console.print(
@@ -130,16 +327,100 @@ class BudgetTrackerCLI:
                 else:
                     return user_input
 
+    def print_paged_table(self, title: str, header_style: str,
+                          columns: tuple, rows: list[tuple]) -> None:
+        """
+        Print rows as a table, PAGE_SIZE rows at a time.
+
+        Column widths are measured once and fixed on every page, so Rich does not
+        measure every cell of a long listing again, and pages line up with each other.
+        When reading from a terminal, the user is asked before each further page.
+
+        Args:
+            title: Table title, shown above the first page
+            header_style: Style of the header row
+            columns: (header, style, justify, no_wrap) of each column
+            rows: Cells of each row, as strings or Text, in column order
+        """
+        widths = [
+            max(cell_len(header), max(cell_len(str(cell)) for cell in cells))
+            for (header, _, _, _), cells in zip(columns, zip(*rows))
+        ]
+        page_size = self.PAGE_SIZE
+        interactive = sys.stdin.isatty()
+        for start in range(0, len(rows), page_size):
+            if start and interactive:
+                shown = f"{start} of {len(rows)} shown"
+                if input(f"-- {shown}. Press Enter for more, or q to stop -- ").strip().lower() == "q":
+                    break
+            table = _make_table(title if not start else None, header_style, columns, widths)
+            add_row = table.add_row
+            for row in rows[start:start + page_size]:
+                add_row(*row)
+            self.console.print(table)
+
+    def print_table(self, header_style: str, columns: tuple, rows: list[tuple]) -> None:
+        """
+        Print rows as plain fixed-width columns, rendered from one flat list of segments.
+
+        On a terminal, results of up to FAST_TABLE_THRESHOLD rows are printed as a
+        Rich table instead, unless rich_tables was turned off.
+
+        Args:
+            header_style: Style of the header row
+            columns: (header, style, justify, no_wrap) of each column
+            rows: Cells of each row, as strings, in column order
+        """
+        # Measured once here, so neither path leaves Rich to measure every cell
+        widths = [
+            max(cell_len(header), max(map(cell_len, cells)))
+            for (header, _, _, _), cells in zip(columns, zip(*rows))
+        ]
+        if self.rich_tables and self._is_tty and len(rows) <= self.FAST_TABLE_THRESHOLD:
+            table = _make_table(None, header_style, columns, widths)
+            add_row = table.add_row
+            for row in rows:
+                add_row(*row)
+            self.console.print(table)
+            return
+
+        right = [justify == "right" for _, _, justify, _ in columns]
+        styles = [Style.parse(style) for _, style, _, _ in columns]
+        # A left-aligned last column needs no padding, which would only trail each line
+        pad_widths = widths if right[-1] else widths[:-1] + [0]
+
+        # One flat run of segments, so Rich neither measures cells nor lays out a table
+        gap = Segment("  ")
+        newline = Segment.line()
+        header = "  ".join(header.rjust(width) if is_right else header.ljust(width)
+                           for (header, _, _, _), width, is_right in zip(columns, pad_widths, right))
+        segments = [
+            Segment(header, Style.parse(header_style)), newline,
+            Segment("  ".join("─" * width for width in widths)), newline,
+        ]
+        add = segments.append
+        for row in rows:
+            for i, (cell, width, is_right, style) in enumerate(zip(row, pad_widths, right, styles)):
+                if i:
+                    add(gap)
+                pad = " " * (width - cell_len(cell))
+                add(Segment(pad + cell if is_right else cell + pad, style))
+            add(newline)
+
+        self.console.print(Segments(segments), end="", crop=False, soft_wrap=True)
+
     def income_management_menu(self) -> None:
         """Handle income management operations."""
         while True:
-            self.console.print("\n[bold blue]💰 Income Management[/bold blue]")
-            self.console.print("1. Add Income Entry")
-            self.console.print("2. View All Income")
-            self.console.print("3. Delete Income Entry")
-            self.console.print("4. Back to Main Menu")
+            self.console.print(
+                "\n[bold blue]💰 Income Management[/bold blue]\n"
+                "1. Add Income Entry\n"
+                "2. View All Income\n"
+                "3. Delete Income Entry\n"
+                "4. Back to Main Menu"
+            )
             
-            choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"])
+            choice = self._ask_digit("Choose an option", "1234")
             
             if choice == "1":
                 self.add_income_entry()
@@ -208,26 +489,22 @@ class BudgetTrackerCLI:
             self.console.print("[yellow]No income entries found.[/yellow]")
             return
         
-        table = Table(title="All Income Entries", show_header=True, header_style="bold green")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Date", style="white")
-        table.add_column("Source", style="green")
-        table.add_column("Amount", style="green", justify="right")
-        table.add_column("Description", style="white")
-        
+        rows = []
+        total_income = 0.0
+        # Locals for the row loop, which can run over thousands of entries
+        add_row, fmt_currency, truncate = rows.append, format_currency, truncate_string
         for income in income_entries:
-            table.add_row(
+            total_income += income.amount
+            add_row((
                 str(income.id),
-                format_date(income.date, output_format='%Y-%m-%d'),
-                f"[italic]{income.source}[/italic]" if income.alias else income.source,
-                format_currency(income.amount),
-                income.description[:30] + "..." if len(income.description) > 30 else income.description
-            )
-        
-        self.console.print(table)
+                income.date,
+                Text(income.source, style="italic") if income.alias else income.source,
+                fmt_currency(income.amount),
+                truncate(income.description)
+            ))
+        self.print_paged_table("All Income Entries", "bold green", INCOME_COLUMNS, rows)
         
         # Show summary
-        total_income = sum(income.amount for income in income_entries)
         self.console.print(f"\n[bold green]Total Income: {format_currency(total_income)}[/bold green]")
 
     def delete_income_entry(self) -> None:
@@ -245,10 +522,10 @@ class BudgetTrackerCLI:
             table.add_column("Description", style="red")
             table.add_row(
                 str(deleted_entry.id),
-                format_date(deleted_entry.date, output_format='%Y-%m-%d'),
+                deleted_entry.date,
                 deleted_entry.source,
                 format_currency(deleted_entry.amount),
-                deleted_entry.description[:30] + "..."
+                truncate_string(deleted_entry.description)
             )
             self.console.print(table)
 
@@ -262,13 +539,15 @@ class BudgetTrackerCLI:
     def expense_management_menu(self) -> None:
         """Handle expense management operations."""
         while True:
-            self.console.print("\n[bold red]💸 Expense Management[/bold red]")
-            self.console.print("1. Add Expense Entry")
-            self.console.print("2. View All Expenses")
-            self.console.print("3. Delete Expense Entry")
-            self.console.print("4. Back to Main Menu")
+            self.console.print(
+                "\n[bold red]💸 Expense Management[/bold red]\n"
+                "1. Add Expense Entry\n"
+                "2. View All Expenses\n"
+                "3. Delete Expense Entry\n"
+                "4. Back to Main Menu"
+            )
             
-            choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"])
+            choice = self._ask_digit("Choose an option", "1234")
             
             if choice == "1":
                 self.add_expense_entry()
@@ -345,10 +624,10 @@ class BudgetTrackerCLI:
             table.add_column("Description", style="red")
             table.add_row(
                 str(deleted_entry.id),
-                format_date(deleted_entry.date, output_format='%Y-%m-%d'),
+                deleted_entry.date,
                 deleted_entry.category,
                 format_currency(deleted_entry.amount),
-                deleted_entry.description[:30] + "..."
+                truncate_string(deleted_entry.description)
             )
             self.console.print(table)
 
@@ -365,38 +644,36 @@ class BudgetTrackerCLI:
             self.console.print("[yellow]No expense entries found.[/yellow]")
             return
         
-        table = Table(title="All Expense Entries", show_header=True, header_style="bold red")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Date", style="white")
-        table.add_column("Category", style="red")
-        table.add_column("Amount", style="red", justify="right")
-        table.add_column("Description", style="white")
-        
+        rows = []
+        total_expenses = 0.0
+        # Locals for the row loop, which can run over thousands of entries
+        add_row, fmt_currency, truncate = rows.append, format_currency, truncate_string
         for expense in expense_entries:
-            table.add_row(
+            total_expenses += expense.amount
+            add_row((
                 str(expense.id),
-                format_date(expense.date, output_format='%Y-%m-%d'),
-                f"[italic]{expense.category}[/italic]" if expense.alias else expense.category,
-                format_currency(expense.amount),
-                expense.description[:30] + "..." if len(expense.description) > 30 else expense.description
-            )
-        
-        self.console.print(table)
+                expense.date,
+                Text(expense.category, style="italic") if expense.alias else expense.category,
+                fmt_currency(expense.amount),
+                truncate(expense.description)
+            ))
+        self.print_paged_table("All Expense Entries", "bold red", EXPENSE_COLUMNS, rows)
         
         # Show summary
-        total_expenses = sum(expense.amount for expense in expense_entries)
         self.console.print(f"\n[bold red]Total Expenses: {format_currency(total_expenses)}[/bold red]")
     
     def budget_management_menu(self) -> None:
         """Handle budget management operations."""
         while True:
-            self.console.print("\n[bold blue]📊 Budget Management[/bold blue]")
-            self.console.print("1. Set Budget Limit")
-            self.console.print("2. View Budget Status")
-            self.console.print("3. View All Budget Limits")
-            self.console.print("4. Back to Main Menu")
+            self.console.print(
+                "\n[bold blue]📊 Budget Management[/bold blue]\n"
+                "1. Set Budget Limit\n"
+                "2. View Budget Status\n"
+                "3. View All Budget Limits\n"
+                "4. Back to Main Menu"
+            )
             
-            choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"])
+            choice = self._ask_digit("Choose an option", "1234")
             
             if choice == "1":
                 self.set_budget_limit()
@@ -413,8 +690,7 @@ class BudgetTrackerCLI:
         
         try:
             # Get category
-            common_categories = get_common_expense_categories()
-            self.console.print(f"Common categories: {', '.join(common_categories)}")
+            self.console.print(f"Common categories: {self._common_expense_categories_text}")
             category = Prompt.ask("Category")
             
             if not validate_category(category):
@@ -430,7 +706,7 @@ class BudgetTrackerCLI:
                 return
             
             # Get description
-            description = Prompt.ask("Description (optional)", default="")
+            description = self._raw_input("Description (optional)")
             if not validate_description(description):
                 self.console.print("[red]Description too long.[/red]")
                 return
@@ -459,24 +735,20 @@ class BudgetTrackerCLI:
             self.console.print("[yellow]No budget limits set.[/yellow]")
             return
         
-        table = Table(title=f"Budget Status - {format_date(f'{current_date.year}-{current_date.month:02d}-01', output_format='%B %Y')}", 
-                     show_header=True, header_style="bold blue")
-        table.add_column("Category", style="cyan")
-        table.add_column("Limit", style="white", justify="right")
-        table.add_column("Spent", style="red", justify="right")
-        table.add_column("Remaining", style="green", justify="right")
-        table.add_column("Status", style="white")
+        table = _make_table(f"Budget Status - {current_date.strftime('%B %Y')}",
+                            "bold blue", BUDGET_STATUS_COLUMNS)
+        add_row = table.add_row
         
-        for category, status in budget_status.items():
-            status_icon = "🔴" if status['is_over_budget'] else "🟢"
-            remaining = format_currency(status['remaining']) if status['remaining'] > 0 else "$0.00"
+        for status in budget_status:
+            status_icon = "🔴" if status.is_over_budget else "🟢"
+            remaining = format_currency(status.remaining) if status.remaining > 0 else "$0.00"
             
-            table.add_row(
-                category,
-                format_currency(status['limit']),
-                format_currency(status['spent']),
+            add_row(
+                status.category,
+                format_currency(status.limit),
+                format_currency(status.spent),
                 remaining,
-                f"{status_icon} {status['percentage_used']:.1f}%"
+                f"{status_icon} {status.percentage_used:.1f}%"
             )
         
         self.console.print(table)
@@ -497,13 +769,11 @@ class BudgetTrackerCLI:
             self.console.print("[yellow]No budget limits set.[/yellow]")
             return
         
-        table = Table(title="All Budget Limits", show_header=True, header_style="bold blue")
-        table.add_column("Category", style="cyan")
-        table.add_column("Monthly Limit", style="white", justify="right")
-        table.add_column("Description", style="white")
+        table = _make_table("All Budget Limits", "bold blue", BUDGET_LIMIT_COLUMNS)
+        add_row = table.add_row
         
         for budget_limit in budget_limits:
-            table.add_row(
+            add_row(
                 budget_limit.category,
                 format_currency(budget_limit.monthly_limit),
                 budget_limit.description
@@ -514,14 +784,16 @@ class BudgetTrackerCLI:
     def savings_goals_menu(self) -> None:
         """Handle savings goals operations."""
         while True:
-            self.console.print("\n[bold yellow]🎯 Savings Goals[/bold yellow]")
-            self.console.print("1. Create New Goal")
-            self.console.print("2. View All Goals")
-            self.console.print("3. Add Progress to Goal")
-            self.console.print("4. View Goals Summary")
-            self.console.print("5. Back to Main Menu")
+            self.console.print(
+                "\n[bold yellow]🎯 Savings Goals[/bold yellow]\n"
+                "1. Create New Goal\n"
+                "2. View All Goals\n"
+                "3. Add Progress to Goal\n"
+                "4. View Goals Summary\n"
+                "5. Back to Main Menu"
+            )
             
-            choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5"])
+            choice = self._ask_digit("Choose an option", "12345")
             
             if choice == "1":
                 self.create_savings_goal()
@@ -560,8 +832,7 @@ class BudgetTrackerCLI:
                 return
             
             # Get category
-            common_categories = get_common_goal_categories()
-            self.console.print(f"Common categories: {', '.join(common_categories)}")
+            self.console.print(f"Common categories: {self._common_goal_categories_text}")
             category = Prompt.ask("Category")
             
             if not validate_category(category):
@@ -569,7 +840,7 @@ class BudgetTrackerCLI:
                 return
             
             # Get description
-            description = Prompt.ask("Description (optional)", default="")
+            description = self._raw_input("Description (optional)")
             if not validate_description(description):
                 self.console.print("[red]Description too long.[/red]")
                 return
@@ -602,24 +873,24 @@ class BudgetTrackerCLI:
             self.console.print("[yellow]No savings goals found.[/yellow]")
             return
         
-        table = Table(title="All Savings Goals", show_header=True, header_style="bold yellow")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Name", style="white")
-        table.add_column("Category", style="yellow")
-        table.add_column("Progress", style="green", justify="right")
-        table.add_column("Target Date", style="white")
-        table.add_column("Status", style="white")
+        self._render_goals(goals)
+    
+    def _render_goals(self, goals: list[SavingsGoal]) -> None:
+        """Print the given goals as the savings goals table."""
+        table = _make_table("All Savings Goals", "bold yellow", GOAL_COLUMNS)
         
+        today = date.today()
+        add_row, fmt_currency, icons = table.add_row, format_currency, _GOAL_ICONS
         for goal in goals:
-            status_icon = "✅" if goal.is_completed else "🔴" if goal.is_overdue else "🟡"
-            progress_text = f"{format_currency(goal.current_amount)} / {format_currency(goal.target_amount)}"
+            status_icon = icons[goal.is_completed << 1 | goal.is_overdue_on(today)]
+            progress_text = f"{fmt_currency(goal.current_amount)} / {fmt_currency(goal.target_amount)}"
             
-            table.add_row(
+            add_row(
                 str(goal.id),
                 goal.name,
                 goal.category,
                 progress_text,
-                format_date(goal.target_date, output_format='%Y-%m-%d'),
+                goal.target_date,
                 f"{status_icon} {goal.progress_percentage:.1f}%"
             )
         
@@ -629,17 +900,18 @@ class BudgetTrackerCLI:
         """Add progress to a savings goal."""
         self.console.print("\n[bold yellow]Add Progress to Goal[/bold yellow]")
         
-        # First show all goals
-        goals = self.goal_tracker.get_active_goals()
-        if not goals:
+        # First show all goals, loaded once and reused for the ID lookup
+        goals = self.goal_tracker.get_all_goals()
+        if not self.goal_tracker.get_active_goals(goals):
             self.console.print("[yellow]No active goals found.[/yellow]")
             return
         
-        self.view_all_goals()
+        self._render_goals(goals)
+        goals_by_id = {goal.id: goal for goal in goals}
         
         try:
             goal_id = int(Prompt.ask("Enter goal ID"))
-            goal = self.goal_tracker.get_goal_by_id(goal_id)
+            goal = goals_by_id.get(goal_id)
             
             if not goal:
                 self.console.print("[red]Goal not found.[/red]")
@@ -688,14 +960,17 @@ class BudgetTrackerCLI:
     def reports_menu(self) -> None:
         """Handle reports and analytics operations."""
         while True:
-            self.console.print("\n[bold magenta]📈 Reports & Analytics[/bold magenta]")
-            self.console.print("1. Monthly Summary Report")
-            self.console.print("2. Goals Summary Report")
-            self.console.print("3. Generate Charts")
-            self.console.print("4. Comprehensive Report")
-            self.console.print("5. Back to Main Menu")
+            self.console.print(
+                "\n[bold magenta]📈 Reports & Analytics[/bold magenta]\n"
+                "1. Monthly Summary Report\n"
+                "2. Goals Summary Report\n"
+                "3. Generate Charts\n"
+                "4. Comprehensive Report\n"
+                "5. Export Expenses to CSV\n"
+                "6. Back to Main Menu"
+            )
             
-            choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5"])
+            choice = self._ask_digit("Choose an option", "123456")
             
             if choice == "1":
                 self.generate_monthly_report()
@@ -706,6 +981,8 @@ class BudgetTrackerCLI:
             elif choice == "4":
                 self.generate_comprehensive_report()
             elif choice == "5":
+                self.export_expenses_csv()
+            elif choice == "6":
                 break
     
     def generate_monthly_report(self) -> None:
@@ -714,16 +991,14 @@ class BudgetTrackerCLI:
         year = current_date.year
         month = current_date.month
         
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-            task = progress.add_task("Generating monthly report...", total=None)
+        with self._spinner("Generating monthly report..."):
             self.report_generator.generate_monthly_summary(year, month)
         
         self.console.print("[green]✅ Monthly summary report generated![/green]")
     
     def generate_goals_report(self) -> None:
         """Generate goals summary report."""
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-            task = progress.add_task("Generating goals report...", total=None)
+        with self._spinner("Generating goals report..."):
             self.report_generator.generate_goals_summary()
         
         self.console.print("[green]✅ Goals summary report generated![/green]")
@@ -734,25 +1009,25 @@ class BudgetTrackerCLI:
         year = current_date.year
         month = current_date.month
         
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-            task = progress.add_task("Generating charts...", total=None)
-            
-            self.report_generator.generate_spending_chart(year, month)
-            self.report_generator.generate_budget_status_chart(year, month)
-            self.report_generator.generate_goals_progress_chart()
-            self.report_generator.generate_income_vs_expenses_chart(year, month)
-            self.report_generator.generate_monthly_trend_chart()
+        with self._spinner("Generating charts..."):
+            self.report_generator.generate_all_charts(year, month)
         
         self.console.print("[green]✅ All charts generated![/green]")
     
+    def export_expenses_csv(self) -> None:
+        """Export all expenses to a CSV file."""
+        with self._spinner("Exporting expenses..."):
+            filename = self.report_generator.export_expenses_csv()
+        
+        self.console.print(f"[green]✅ Expenses exported to {filename}[/green]")
+    
     def generate_comprehensive_report(self) -> None:
         """Generate comprehensive report."""
         current_date = date.today()
         year = current_date.year
         month = current_date.month
         
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}")) as progress:
-            task = progress.add_task("Generating comprehensive report...", total=None)
+        with self._spinner("Generating comprehensive report..."):
             self.report_generator.generate_comprehensive_report(year, month)
         
         self.console.print("[green]✅ Comprehensive report generated![/green]")
@@ -760,12 +1035,14 @@ class BudgetTrackerCLI:
     def search_menu(self) -> None:
         """Handle search and view data operations."""
         while True:
-            self.console.print("\n[bold cyan]🔍 Search & View Data[/bold cyan]")
-            self.console.print("1. Search Entries")
-            self.console.print("2. View Monthly Summary")
-            self.console.print("3. Back to Main Menu")
+            self.console.print(
+                "\n[bold cyan]🔍 Search & View Data[/bold cyan]\n"
+                "1. Search Entries\n"
+                "2. View Monthly Summary\n"
+                "3. Back to Main Menu"
+            )
             
-            choice = Prompt.ask("Choose an option", choices=["1", "2", "3"])
+            choice = self._ask_digit("Choose an option", "123")
             
             if choice == "1":
                 self.search_entries()
@@ -789,92 +1066,105 @@ class BudgetTrackerCLI:
                 query = query[1:]
                 exclude = True
 
-            matching_income, matching_expenses = self.budget_manager.search_entries(query, exclude=exclude)
-
-            if not matching_income and not matching_expenses:
-                self.console.print(f"[yellow]No entries found matching '{query}'.[/yellow]")
-                return
-
-            net_income = 0
-            if matching_income:
-                self.console.print(f"\n[bold green]Income Entries ({len(matching_income)})[/bold green]")
-                table = Table(show_header=True, header_style="bold green")
-                table.add_column("Date", style="white")
-                table.add_column("Source", style="green")
-                table.add_column("Amount", style="green", justify="right")
-                table.add_column("Description", style="white")
-
-                for income in matching_income:
-                    net_income += income.amount
-                    table.add_row(
-                        format_date(income.date, output_format='%Y-%m-%d'),
-                        income.source,
-                        format_currency(income.amount),
-                        income.description
-                    )
-
-                self.console.print(table)
-
-            net_expenses = 0
-            if matching_expenses:
-                self.console.print(f"\n[bold red]Expense Entries ({len(matching_expenses)})[/bold red]")
-                table = Table(show_header=True, header_style="bold red")
-                table.add_column("Date", style="white")
-                table.add_column("Category", style="red")
-                table.add_column("Amount", style="red", justify="right")
-                table.add_column("Description", style="white")
-
-                for expense in matching_expenses:
-                    net_expenses -= expense.amount
-                    table.add_row(
-                        format_date(expense.date, output_format='%Y-%m-%d'),
-                        expense.category,
-                        format_currency(expense.amount),
-                        expense.description
-                    )
-
-                self.console.print(table)
-
-            matching_sum = net_expenses + net_income
-            self.console.print(f"\nNet income: [bold green]{format_currency(net_income)}[/bold green]")
-            self.console.print(f"Net expenses: [bold red]{format_currency(net_expenses)}[/bold red]")
-            if matching_sum >= 0:
-                self.console.print(f"[green]Total: {format_currency(matching_sum)}[/green]")
-            else:
-                self.console.print(f"[red]Total: {format_currency(matching_sum)}[/red]")
+            # Both result tables and the totals reach the terminal in one write
+            with self._batched_output():
+                self._print_search_results(query, self.budget_manager.iter_search_entries(query, exclude=exclude))
 
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Operation cancelled.[/yellow]")
         except Exception as e:
             self.console.print(f"[red]❌ Error adding alias: {e}[/red]")
 
-    
+    def _print_search_results(self, query: str, results) -> None:
+        """
+        Print the income and expense tables of a search, followed by the totals.
+
+        The results are consumed in one pass: each entry is formatted into the rows
+        of its table as it arrives, and no list of entries is kept.
+
+        Args:
+            query: The search term, for the message shown when nothing matched
+            results: (kind, entry) pairs, as yielded by BudgetManager.iter_search_entries
+        """
+        income_rows = []
+        expense_rows = []
+        add_income_row = income_rows.append
+        add_expense_row = expense_rows.append
+        net_income = 0.0
+        net_expenses = 0.0
+        # Amounts are formatted inline, as format_currency would, to skip a call per row
+        for kind, entry in results:
+            if kind == 'income':
+                net_income += entry.amount
+                add_income_row((entry.date, entry.source, f"${entry.amount:,.2f}", entry.description))
+            else:
+                net_expenses -= entry.amount
+                add_expense_row((entry.date, entry.category, f"${entry.amount:,.2f}", entry.description))
+
+        if not income_rows and not expense_rows:
+            self.console.print(f"[yellow]No entries found matching '{query}'.[/yellow]")
+            return
+
+        if income_rows:
+            self.console.print(f"\n[bold green]Income Entries ({len(income_rows)})[/bold green]")
+            self.print_table("bold green", SEARCH_INCOME_COLUMNS, income_rows)
+
+        if expense_rows:
+            self.console.print(f"\n[bold red]Expense Entries ({len(expense_rows)})[/bold red]")
+            self.print_table("bold red", SEARCH_EXPENSE_COLUMNS, expense_rows)
+
+        matching_sum = net_expenses + net_income
+        self.console.print(f"\nNet income: [bold green]{format_currency(net_income)}[/bold green]")
+        self.console.print(f"Net expenses: [bold red]{format_currency(net_expenses)}[/bold red]")
+        if matching_sum >= 0:
+            self.console.print(f"[green]Total: {format_currency(matching_sum)}[/green]")
+        else:
+            self.console.print(f"[red]Total: {format_currency(matching_sum)}[/red]")
+
+    @contextmanager
+    def _batched_output(self):
+        """Collect everything printed to the console in the block and write it in one call."""
+        console = self.console
+        file = console.file
+        buffer = StringIO()
+        console.file = buffer
+        try:
+            yield
+        finally:
+            console.file = file
+            file.write(buffer.getvalue())
+            file.flush()
+
     def view_monthly_summary(self) -> None:
         """View monthly financial summary."""
         current_date = date.today()
         monthly_summary = self.budget_manager.get_monthly_summary(current_date.year, current_date.month)
         
-        summary_text = f"""
-        Month: {format_date(f'{current_date.year}-{current_date.month:02d}-01', output_format='%B %Y')}
-        
-        Total Income: {format_currency(monthly_summary['total_income'])}
-        Total Expenses: {format_currency(monthly_summary['total_expenses'])}
-        Net Income: {format_currency(monthly_summary['net_income'])}
-        Savings Rate: {monthly_summary['savings_rate']:.1f}%
-        """
+        summary_text = _MONTHLY_SUMMARY_TEMPLATE.format(
+            month=current_date.strftime('%B %Y'),
+            income=monthly_summary['total_income'],
+            expenses=monthly_summary['total_expenses'],
+            net=monthly_summary['net_income'],
+            rate=monthly_summary['savings_rate'],
+        )
         
-        self.console.print(Panel(summary_text, title="Monthly Summary", border_style="blue"))
+        if self._is_tty:
+            self.console.print(Panel(summary_text, title="Monthly Summary", border_style="blue"))
+        else:
+            self.console.print(summary_text, highlight=False)
 
     def advanced_options_menu(self) -> None:
         """Handle advanced operations."""
         while True:
-            self.console.print("\n[bold dark_orange]⚙️ Advanced Options[/bold dark_orange]")
-            self.console.print("1. Create and Manage Aliases")
-            self.console.print("2. Reindex Tables")
-            self.console.print("3. Create Backup")
-            self.console.print("4. Back to Main Menu")
+            self.console.print(
+                "\n[bold dark_orange]⚙️ Advanced Options[/bold dark_orange]\n"
+                "1. Create and Manage Aliases\n"
+                "2. Reindex Tables\n"
+                "3. Create Backup\n"
+                "4. Back to Main Menu"
+            )
 
-            choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4"])
+            choice = self._ask_digit("Choose an option", "1234")
 
             if choice == "1":
                 self.alias_menu()
@@ -897,17 +1187,19 @@ class BudgetTrackerCLI:
         """A menu to handle alias options."""
         try:
             while True:
-                self.console.print("\n[bold gold3]🏷️ Alias Management[/bold gold3]")
-                self.console.print("1. Create Alias")
-                self.console.print("2. View Aliases")
-                self.console.print("3. Delete Alias")
-                self.console.print("4. Rename Alias")
-                self.console.print("5. Back to Options Menu")
+                self.console.print(
+                    "\n[bold gold3]🏷️ Alias Management[/bold gold3]\n"
+                    "1. Create Alias\n"
+                    "2. View Aliases\n"
+                    "3. Delete Alias\n"
+                    "4. Rename Alias\n"
+                    "5. Back to Options Menu"
+                )
 #TODO: CREATE RENAMING ALIASES
     #TODO: TEST RENAMING ALIASES
 #TODO: EDIT DELETE ALIAS TO GIVE OPTIONS TO CHANGE THE NAMES OF THINGS THAT HAVE THAT ALIAS
 
-                choice = Prompt.ask("Choose an option", choices=["1", "2", "3", "4", "5"])
+                choice = self._ask_digit("Choose an option", "12345")
 
                 if choice == "1":
                     self.add_alias_entry()
@@ -968,14 +1260,11 @@ class BudgetTrackerCLI:
                 self.console.print(f"[yellow]No aliases found for '{alias_table}'.[/yellow]")
             return
 
-        table = Table(title=f"{alias_table.capitalize()} Aliases", show_header=True, header_style="bold gold3")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Alias", style="dark_orange")
-        table.add_column("Full Name", style="yellow")
-        table.add_column("Type", style="white")
+        table = _make_table(f"{alias_table.capitalize()} Aliases", "bold gold3", ALIAS_COLUMNS)
+        add_row = table.add_row
 
         for alias in aliases:
-            table.add_row(
+            add_row(
                 str(alias.id),
                 alias.alias,
                 alias.full_name,
@@ -987,11 +1276,7 @@ class BudgetTrackerCLI:
     def view_aliases_small(self, table: str) -> list[str]:
         """View all aliases in a smaller table. Returned as a list of alias strings."""
         aliases = self.budget_manager.get_all_aliases(table)
-        result: list[str] = []
-        for alias in aliases:
-            result.append(f"({alias.alias}): {alias.full_name}")
-
-        return result
+        return [f"({alias.alias}): {alias.full_name}" for alias in aliases]
 
 
     def delete_alias_entry(self) -> None:
@@ -1085,13 +1370,15 @@ class BudgetTrackerCLI:
         """Menu to select which table to reindex."""
         try:
             while True:
-                self.console.print("\n[italic dark_orange]Which table do you want to reindex?[/italic dark_orange]")
-                self.console.print("[bold red]⚠️ WARNING: This is a destructive operation. It will ruin any connections between tables[/bold red]")
-                self.console.print("1. Income Table")
-                self.console.print("2. Expense Table")
-                self.console.print("3. Back to Advanced Options")
+                self.console.print(
+                    "\n[italic dark_orange]Which table do you want to reindex?[/italic dark_orange]\n"
+                    "[bold red]⚠️ WARNING: This is a destructive operation. It will ruin any connections between tables[/bold red]\n"
+                    "1. Income Table\n"
+                    "2. Expense Table\n"
+                    "3. Back to Advanced Options"
+                )
 
-                choice = Prompt.ask("Choose an option", choices=["1", "2", "3"])
+                choice = self._ask_digit("Choose an option", "123")
 
                 if choice == "1":
                     confirmation = self.ask_confirmation("Yes", "No")
@@ -1119,9 +1406,11 @@ class BudgetTrackerCLI:
     def ask_confirmation(self, yes: str = "Yes", no: str = "No") -> bool:
         """Ask yes-no confirmation."""
         while True:
-            self.console.print("\n[bold red]Are you sure?[/bold red]")
-            self.console.print(f"{yes}. Confirm")
-            self.console.print(f"{no}. Deny")
+            self.console.print(
+                "\n[bold red]Are you sure?[/bold red]\n"
+                f"{yes}. Confirm\n"
+                f"{no}. Deny"
+            )
 
             choice = Prompt.ask("Choose an option", choices=[f"{yes}", f"{no}"])
 
@@ -1131,6 +1420,11 @@ class BudgetTrackerCLI:
                 return False
 
 
+    def _quit(self) -> None:
+        """Say goodbye and stop the main loop."""
+        self.console.print("\n[bold green]Thank you for using Budget Tracker![/bold green]")
+        self.running = False
+
     def run(self) -> None:
         """Run the main application loop."""
         welcome_debug = self.config_manager.config_log.strip()
@@ -1141,35 +1435,30 @@ class BudgetTrackerCLI:
                 self.display_main_menu()
                 choice = self.get_user_choice()
                 
-                if choice == "1":
-                    self.income_management_menu()
-                elif choice == "2":
-                    self.expense_management_menu()
-                elif choice == "3":
-                    self.search_menu()
-                elif choice == "4":
-                    self.budget_management_menu()
-                elif choice == "5":
-                    self.savings_goals_menu()
-                elif choice == "6":
-                    self.reports_menu()
-                elif choice == "7":
-                    self.advanced_options_menu()
-                elif choice == "8":
-                    self.console.print("\n[bold green]Thank you for using Budget Tracker![/bold green]")
-                    self.running = False
+                try:
+                    self._menu_dispatch[choice]()
+                # Bad input and failed database or file operations are expected
+                except (ValueError, OSError) as e:
+                    self.console.print(f"\n[red]❌ Error: {e}[/red]")
+                # Anything else is a bug in one action; report it and keep the session going
+                except Exception as e:
+                    self.console.print(f"\n[red]❌ Unexpected error: {e}[/red]")
                 
-            except KeyboardInterrupt:
+            # ^C, or stdin closed (^D or the end of piped input)
+            except (KeyboardInterrupt, EOFError):
                 self.console.print("\n\n[yellow]Exiting...[/yellow]")
                 self.running = False
-            except Exception as e:
-                self.console.print(f"\n[red]❌ Unexpected error: {e}[/red]")
 
 
 def main():
     """Main entry point for the application."""
+    parser = argparse.ArgumentParser(description="Track income, expenses, budgets and savings goals.")
+    parser.add_argument("--plain", action="store_true",
+                        help="print search results as plain text instead of Rich tables")
+    args = parser.parse_args()
+
     try:
-        app = BudgetTrackerCLI()
+        app = BudgetTrackerCLI(rich_tables=not args.plain)
         app.run()
     except Exception as e:
         console = Console()
@@ -6,16 +6,37 @@ analytics, and visualizations using matplotlib.
 """
 
 import os
+import re
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Tuple, Optional
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import numpy as np
 
-from better_budget_tracker.budget import BudgetManager, IncomeEntry, ExpenseEntry, BudgetLimit
+from better_budget_tracker.budget import BudgetManager, IncomeEntry, ExpenseEntry, BudgetLimit, monthly_totals
 from better_budget_tracker.goal_tracker import GoalTracker, SavingsGoal
 from better_budget_tracker.utils import format_currency, format_date, format_percentage, get_month_start_date, get_month_end_date
 
+# Chart methods run by generate_all_charts, and whether each takes (year, month)
+_CHART_METHODS = (
+    ("generate_spending_chart", True),
+    ("generate_budget_status_chart", True),
+    ("generate_goals_progress_chart", False),
+    ("generate_income_vs_expenses_chart", True),
+    ("generate_monthly_trend_chart", False),
+)
+
+# Expense exports are written this many rows at a time
+_CSV_CHUNK_ROWS = 1000
+_CSV_SPECIAL_RE = re.compile(r'[",\r\n]')
+
+
+def _csv_field(value: str) -> str:
+    """Quote a text field for CSV if it contains a comma, quote or line break."""
+    if _CSV_SPECIAL_RE.search(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 
 class ReportGenerator:
     """Generates various reports and visualizations for budget tracking."""
@@ -51,12 +72,12 @@ class ReportGenerator:
         """
         monthly_summary = self.budget_manager.get_monthly_summary(year, month)
         budget_status = self.budget_manager.get_budget_status(year, month)
-        category_summary = self.budget_manager.get_category_summary(year, month)
+        category_summary, total_expenses = self.budget_manager.get_category_breakdown(year, month)
         overspending_alerts = self.budget_manager.get_overspending_alerts(year, month)
         
         report_lines = []
         report_lines.append("=" * 60)
-        report_lines.append(f"MONTHLY FINANCIAL SUMMARY - {format_date(f'{year}-{month:02d}-01', output_format='%B %Y')}")
+        report_lines.append(f"MONTHLY FINANCIAL SUMMARY - {date(year, month, 1).strftime('%B %Y')}")
         report_lines.append("=" * 60)
         report_lines.append(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
         report_lines.append("")
@@ -74,12 +95,12 @@ class ReportGenerator:
         if budget_status:
             report_lines.append("BUDGET STATUS")
             report_lines.append("-" * 15)
-            for category, status in budget_status.items():
-                status_icon = "🔴" if status['is_over_budget'] else "🟢"
-                report_lines.append(f"{status_icon} {category}: {format_currency(status['spent'])} / {format_currency(status['limit'])} "
-                                  f"({status['percentage_used']:.1f}%)")
-                if status['remaining'] > 0:
-                    report_lines.append(f"   Remaining: {format_currency(status['remaining'])}")
+            for status in budget_status:
+                status_icon = "🔴" if status.is_over_budget else "🟢"
+                report_lines.append(f"{status_icon} {status.category}: {format_currency(status.spent)} / {format_currency(status.limit)} "
+                                  f"({status.percentage_used:.1f}%)")
+                if status.remaining > 0:
+                    report_lines.append(f"   Remaining: {format_currency(status.remaining)}")
             report_lines.append("")
         
         # Overspending alerts
@@ -95,8 +116,7 @@ class ReportGenerator:
         if category_summary:
             report_lines.append("EXPENSE BREAKDOWN BY CATEGORY")
             report_lines.append("-" * 30)
-            total_expenses = sum(category_summary.values())
-            for category, amount in sorted(category_summary.items(), key=lambda x: x[1], reverse=True):
+            for category, amount in category_summary.items():
                 percentage = (amount / total_expenses * 100) if total_expenses > 0 else 0
                 report_lines.append(f"{category}: {format_currency(amount)} ({percentage:.1f}%)")
         
@@ -121,11 +141,12 @@ class ReportGenerator:
         Returns:
             str: Generated report content
         """
-        goals_summary = self.goal_tracker.get_goals_summary()
+        all_goals = self.goal_tracker.get_all_goals()
+        goals_summary = self.goal_tracker.get_goals_summary(all_goals)
         category_summary = self.goal_tracker.get_category_summary()
-        active_goals = self.goal_tracker.get_active_goals()
-        completed_goals = self.goal_tracker.get_completed_goals()
-        overdue_goals = self.goal_tracker.get_overdue_goals()
+        active_goals = self.goal_tracker.get_active_goals(all_goals)
+        completed_goals = self.goal_tracker.get_completed_goals(all_goals)
+        overdue_goals = self.goal_tracker.get_overdue_goals(all_goals)
         
         report_lines = []
         report_lines.append("=" * 60)
@@ -151,12 +172,13 @@ class ReportGenerator:
         if active_goals:
             report_lines.append("ACTIVE GOALS")
             report_lines.append("-" * 15)
+            today = date.today()
             for goal in active_goals:
-                status_icon = "🔴" if goal.is_overdue else "🟡"
+                status_icon = "🔴" if goal.is_overdue_on(today) else "🟡"
                 report_lines.append(f"{status_icon} {goal.name} ({goal.category})")
                 report_lines.append(f"   Progress: {format_currency(goal.current_amount)} / {format_currency(goal.target_amount)} "
                                   f"({goal.progress_percentage:.1f}%)")
-                report_lines.append(f"   Target Date: {format_date(goal.target_date)} ({goal.days_remaining} days remaining)")
+                report_lines.append(f"   Target Date: {format_date(goal.target_date)} ({goal.days_remaining_on(today)} days remaining)")
                 if goal.description:
                     report_lines.append(f"   Description: {goal.description}")
                 report_lines.append("")
@@ -229,7 +251,7 @@ class ReportGenerator:
         )
         
         # Customize the chart
-        plt.title(f'Spending by Category - {format_date(f"{year}-{month:02d}-01", output_format="%B %Y")}', 
+        plt.title(f'Spending by Category - {date(year, month, 1).strftime("%B %Y")}', 
                  fontsize=16, fontweight='bold')
         
         # Improve text readability
@@ -270,9 +292,9 @@ class ReportGenerator:
             return None
         
         # Prepare data
-        categories = list(budget_status.keys())
-        limits = [status['limit'] for status in budget_status.values()]
-        spent = [status['spent'] for status in budget_status.values()]
+        categories = [status.category for status in budget_status]
+        limits = [status.limit for status in budget_status]
+        spent = [status.spent for status in budget_status]
         
         # Create bar chart
         x = np.arange(len(categories))
@@ -285,7 +307,7 @@ class ReportGenerator:
         # Customize the chart
         ax.set_xlabel('Categories')
         ax.set_ylabel('Amount')
-        ax.set_title(f'Budget Status - {format_date(f"{year}-{month:02d}-01", output_format="%B %Y")}')
+        ax.set_title(f'Budget Status - {date(year, month, 1).strftime("%B %Y")}')
         ax.set_xticks(x)
         ax.set_xticklabels(categories, rotation=45, ha='right')
         ax.legend()
@@ -325,15 +347,18 @@ class ReportGenerator:
         Returns:
             Optional[str]: Path to saved file if save_to_file is True
         """
-        active_goals = self.goal_tracker.get_active_goals()
+        goal_arrays = self.goal_tracker.load_arrays()
+        active = ~goal_arrays['is_completed']
         
-        if not active_goals:
+        if not active.any():
             print("No active goals available for chart generation.")
             return None
         
-        # Prepare data
-        goal_names = [goal.name for goal in active_goals]
-        progress_percentages = [goal.progress_percentage for goal in active_goals]
+        # Prepare data (same values as SavingsGoal.progress_percentage, computed for all goals at once)
+        goal_names = goal_arrays['names'][active].tolist()
+        progress_percentages = np.minimum(
+            goal_arrays['current_amounts'][active] / goal_arrays['target_amounts'][active] * 100, 100.0
+        ).tolist()
         
         # Create bar chart
         plt.figure(figsize=(12, 6))
@@ -395,7 +420,7 @@ class ReportGenerator:
         bars = plt.bar(categories, amounts, color=colors, alpha=0.7)
         
         # Customize the chart
-        plt.title(f'Income vs Expenses - {format_date(f"{year}-{month:02d}-01", output_format="%B %Y")}', 
+        plt.title(f'Income vs Expenses - {date(year, month, 1).strftime("%B %Y")}', 
                  fontsize=16, fontweight='bold')
         plt.ylabel('Amount')
         plt.grid(True, alpha=0.3, axis='y')
@@ -436,32 +461,25 @@ class ReportGenerator:
         Returns:
             Optional[str]: Path to saved file if save_to_file is True
         """
-        # Get data for the last N months
+        # Get data for the last N months (up to and including the current one)
         end_date = date.today()
-        start_date = end_date - timedelta(days=30 * months)
+        start_date = (end_date - timedelta(days=30 * months)).replace(day=1)
+        n_months = (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
         
         months_data = []
-        income_data = []
-        expense_data = []
-        
         current_date = start_date
-        while current_date <= end_date:
-            year = current_date.year
-            month = current_date.month
-            
-            monthly_summary = self.budget_manager.get_monthly_summary(year, month)
-            
+        for _ in range(n_months):
             months_data.append(current_date)
-            income_data.append(monthly_summary['total_income'])
-            expense_data.append(monthly_summary['total_expenses'])
-            
-            # Move to next month
-            if current_date.month == 12:
-                current_date = current_date.replace(year=current_date.year + 1, month=1)
-            else:
-                current_date = current_date.replace(month=current_date.month + 1)
+            current_date = (current_date + timedelta(days=32)).replace(day=1)
+        
+        # Load the whole range once and bin it by month, instead of one summary query per month
+        first_day, last_day = start_date.isoformat(), end_date.isoformat()
+        income_dates, income_amounts, _ = self.budget_manager.get_income_arrays(first_day, last_day)
+        expense_dates, expense_amounts, _ = self.budget_manager.get_expenses_arrays(first_day, last_day)
+        income_data = monthly_totals(income_dates, income_amounts, start_date.year, start_date.month, n_months)
+        expense_data = monthly_totals(expense_dates, expense_amounts, start_date.year, start_date.month, n_months)
         
-        if not any(income_data) and not any(expense_data):
+        if not income_data.any() and not expense_data.any():
             print("No trend data available for chart generation.")
             return None
         
@@ -496,6 +514,59 @@ class ReportGenerator:
             plt.show()
             return None
     
+    def generate_all_charts(self, year: int, month: int) -> List[Optional[str]]:
+        """
+        Generate and save every chart.
+        
+        Args:
+            year: Year for the monthly charts
+            month: Month for the monthly charts
+            
+        Returns:
+            List[Optional[str]]: Saved chart filenames, None for charts that had no data
+        """
+        return [getattr(self, method_name)(*((year, month) if monthly else ()))
+                for method_name, monthly in _CHART_METHODS]
+    
+    def export_expenses_csv(self, year: Optional[int] = None, month: Optional[int] = None) -> str:
+        """
+        Export expenses to a CSV file in the reports directory.
+        
+        Rows are formatted straight into text and written in chunks, rather than
+        going through csv.writer one row at a time.
+        
+        Args:
+            year: Year of the month to export; all expenses are exported if not given
+            month: Month to export; all expenses are exported if not given
+            
+        Returns:
+            str: Path of the CSV file
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if year is not None and month is not None:
+            first_day = f"{year}-{month:02d}-01"
+            expenses = self.budget_manager.iter_expenses_by_date_range(
+                get_month_start_date(first_day), get_month_end_date(first_day))
+            filename = f"{self.reports_dir}/expenses_{year}_{month:02d}_{timestamp}.csv"
+        else:
+            expenses = self.budget_manager.get_all_expenses()
+            filename = f"{self.reports_dir}/expenses_{timestamp}.csv"
+        
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            f.write("id,date,category,amount,description\n")
+            lines = []
+            add_line = lines.append
+            for expense in expenses:
+                add_line(f"{expense.id},{expense.date},{_csv_field(expense.category)},"
+                         f"{expense.amount:.2f},{_csv_field(expense.description)}\n")
+                if len(lines) == _CSV_CHUNK_ROWS:
+                    f.write("".join(lines))
+                    lines.clear()
+            f.write("".join(lines))
+        print(f"Expenses exported to: {filename}")
+        
+        return filename
+    
     def generate_comprehensive_report(self, year: int, month: int, save_to_file: bool = True) -> str:
         """
         Generate a comprehensive report with all available data and charts.
@@ -517,11 +588,7 @@ class ReportGenerator:
         # Generate charts
         if save_to_file:
             print("Generating charts...")
-            self.generate_spending_chart(year, month, save_to_file=True)
-            self.generate_budget_status_chart(year, month, save_to_file=True)
-            self.generate_goals_progress_chart(save_to_file=True)
-            self.generate_income_vs_expenses_chart(year, month, save_to_file=True)
-            self.generate_monthly_trend_chart(save_to_file=True)
+            self.generate_all_charts(year, month)
         
         # Combine reports
         comprehensive_content = []
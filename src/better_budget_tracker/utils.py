@@ -9,6 +9,9 @@ import re
 from datetime import datetime, date, timedelta
 from typing import Optional, List, Tuple, Union
 
+# Currency symbols, whitespace and thousands separators stripped from amount input
+_CURRENCY_NOISE_RE = re.compile(r'[₹$€£¥\s,]')
+
 
 def validate_amount(amount: Union[str, float, int]) -> bool:
     """
@@ -23,7 +26,7 @@ def validate_amount(amount: Union[str, float, int]) -> bool:
     try:
         if isinstance(amount, str):
             # Remove currency symbols and spaces
-            cleaned = re.sub(r'[₹$€£¥\s,]', '', amount.strip())
+            cleaned = _CURRENCY_NOISE_RE.sub('', amount.strip())
             value = float(cleaned)
         else:
             value = float(amount)
@@ -50,7 +53,7 @@ def parse_amount(amount_input: str) -> float:
         raise ValueError("Amount cannot be empty")
     
     # Remove currency symbols, spaces, and commas
-    cleaned = re.sub(r'[₹$€£¥\s,]', '', amount_input.strip())
+    cleaned = _CURRENCY_NOISE_RE.sub('', amount_input.strip())
     
     try:
         return float(cleaned)
@@ -94,6 +97,11 @@ def format_currency(amount: float, currency_symbol: str = "$") -> str:
     return f"{currency_symbol}{amount:,.2f}"
 
 
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_MONTH_DAY_RE = re.compile(r'^\d{2}-\d{2}$')
+_DAY_RE = re.compile(r'^\d{2}$')
+
+
 def validate_date(date_string: str) -> bool:
     """
     Validate if a date string is in the correct format (YYYY-MM-DD).
@@ -107,14 +115,13 @@ def validate_date(date_string: str) -> bool:
     if not date_string:
         return False
     
-    # Check format with regex
-    date_pattern = r'^\d{4}-\d{2}-\d{2}$'
-    if not re.match(date_pattern, date_string):
+    # Check format with regex (fromisoformat alone also accepts e.g. "20240115")
+    if not _DATE_RE.match(date_string):
         return False
     
     try:
         # Try to parse the date
-        datetime.strptime(date_string, '%Y-%m-%d')
+        date.fromisoformat(date_string)
         return True
     except ValueError:
         return False
@@ -137,11 +144,9 @@ def parse_date(date_string: str) -> str:
         raise ValueError("Date cannot be empty")
 
     # Fix format, check against abridged formats
-    month_pattern = r'^\d{2}-\d{2}$'
-    day_pattern = r'^\d{2}$'
-    if re.match(month_pattern, date_string):
+    if _MONTH_DAY_RE.match(date_string):
         date_string = current_date[:5] + date_string
-    elif re.match(day_pattern, date_string):
+    elif _DAY_RE.match(date_string):
         date_string = current_date[:8] + date_string
     # Check against full format
     # year_pattern = r'^\d{4}-\d{2}-\d{2}$'
@@ -170,6 +175,10 @@ def format_date(date_string: str, input_format: str = '%Y-%m-%d', output_format:
     Raises:
         ValueError: If date string is invalid
     """
+    # An ISO date asked for as an ISO date only needs checking, not reformatting
+    if input_format == output_format == '%Y-%m-%d' and validate_date(date_string):
+        return date_string
+    
     try:
         date_obj = datetime.strptime(date_string, input_format)
         return date_obj.strftime(output_format)
@@ -339,6 +348,7 @@ def get_common_goal_categories() -> List[str]:
 
 Category_invalid_characters = "!,"
 """The invalid characters used for income and expenses input"""
+_CATEGORY_INVALID_RE = re.compile(f"[{re.escape(Category_invalid_characters)}]")
 def validate_category(category: str) -> bool:
     """
     Validate category name.
@@ -349,21 +359,16 @@ def validate_category(category: str) -> bool:
     Returns:
         bool: True if category is valid, False otherwise
     """
-    if not category or not category.strip():
+    if not category:
         return False
 
-    for char in Category_invalid_characters:
-        if char in category:
-            return False
-
-    # Check for reasonable length
-    if len(category.strip()) < 1 or len(category.strip()) > 50:
-        return False
-    
-    return True
+    # Non-blank, reasonable length and none of the invalid characters
+    return (0 < len(category.strip()) <= 50
+            and _CATEGORY_INVALID_RE.search(category) is None)
 
 Alias_invalid_characters = Category_invalid_characters
 """The invalid characters used for aliases. A superset of ``Category_invalid_characters``"""
+_ALIAS_INVALID_RE = re.compile(f"[{re.escape(Alias_invalid_characters)}]")
 def validate_alias(alias: str) -> bool:
     """
     Validate alias name.
@@ -374,19 +379,12 @@ def validate_alias(alias: str) -> bool:
     Returns:
         bool: True if category is valid, False otherwise
     """
-    if not alias or not alias.strip():
-        return False
-
-    for char in Alias_invalid_characters:
-        if char in alias:
-            return False
-
-
-    # Check for reasonable length
-    if len(alias.strip()) < 1 or len(alias.strip()) > 50:
+    if not alias:
         return False
 
-    return True
+    # Non-blank, reasonable length and none of the invalid characters
+    return (0 < len(alias.strip()) <= 50
+            and _ALIAS_INVALID_RE.search(alias) is None)
 
 
 def validate_description(description: str) -> bool:
@@ -0,0 +1,391 @@
+import sqlite3
+
+import pytest
+from src.better_budget_tracker.budget import (
+    BudgetManager,
+    IncomeEntry,
+    ExpenseEntry,
+    BudgetLimit,
+    BudgetStatusRow,
+    AliasEntry,
+    _month_bounds,
+    monthly_totals,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    budget_manager = BudgetManager(db_path=str(tmp_path / "data" / "budget_data.db"))
+    yield budget_manager
+    budget_manager.close()
+
+
+def test_add_income_and_get_all_income(manager):
+    income_id = manager.add_income(
+        IncomeEntry(date="2025-01-05", source="Salary", amount=5000.0, description="Monthly salary")
+    )
+    income_entries = manager.get_all_income()
+    assert [income.id for income in income_entries] == [income_id]
+    assert income_entries[0].source == "Salary"
+    assert income_entries[0].amount == 5000.0
+
+
+def test_add_expense_and_delete_expense(manager):
+    expense_id = manager.add_expense(
+        ExpenseEntry(date="2025-01-06", category="Housing", amount=1500.0, description="Rent")
+    )
+    deleted_entry = manager.delete_expense(expense_id)
+    assert deleted_entry.category == "Housing"
+    assert manager.get_all_expenses() == []
+
+
+def test_delete_income_missing_id(manager):
+    with pytest.raises(KeyError):
+        manager.delete_income(42)
+
+
+def test_connection_is_reused(manager):
+    connection = manager._conn
+    manager.add_income(IncomeEntry(date="2025-01-05", source="Salary", amount=100.0))
+    manager.get_all_income()
+    assert manager._conn is connection
+
+
+def test_database_uses_wal_journal(manager):
+    journal_mode = manager._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+
+
+def test_add_incomes_bulk(manager):
+    added = manager.add_incomes_bulk([
+        IncomeEntry(date="2025-01-01", source="Salary", amount=5000.0),
+        IncomeEntry(date="2025-01-15", source="Freelance", amount=750.0, alias="fl"),
+    ])
+    assert added == 2
+    income_entries = manager.get_all_income()
+    assert [income.source for income in income_entries] == ["Salary", "Freelance"]
+    assert income_entries[1].alias == "fl"
+
+
+def test_add_incomes_bulk_empty(manager):
+    assert manager.add_incomes_bulk([]) == 0
+
+
+def test_add_aliases_bulk(manager):
+    added = manager.add_aliases_bulk([
+        AliasEntry(alias="fl", full_name="Freelance", type="income"),
+        AliasEntry(alias="gr", full_name="Groceries", type="expenses"),
+    ])
+    assert added == 2
+    assert manager.get_alias("gr", "expenses").full_name == "Groceries"
+
+    with pytest.raises(KeyError):
+        manager.add_aliases_bulk([
+            AliasEntry(alias="rent", full_name="Housing", type="expenses"),
+            AliasEntry(alias="fl", full_name="Freelance", type="income"),
+        ])
+    assert manager.get_alias("rent", "expenses") is None
+
+
+def test_indexes_survive_reindex(manager):
+    first_id = manager.add_expense(ExpenseEntry(date="2025-01-05", category="Food", amount=20.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-06", category="Housing", amount=1500.0))
+    manager.delete_expense(first_id)
+    manager.reindex_table("expenses")
+    assert [expense.id for expense in manager.get_all_expenses()] == [1]
+    index_names = {row[0] for row in manager._conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'expenses'"
+    )}
+    assert {"idx_expenses_date", "idx_expenses_date_int", "idx_expenses_cat_date_int"} <= index_names
+
+
+def test_reindex_compact_table_resets_sequence(manager):
+    manager.add_income(IncomeEntry(date="2025-01-05", source="Salary", amount=100.0))
+    manager.delete_income(manager.add_income(IncomeEntry(date="2025-01-06", source="Bonus", amount=50.0)))
+    assert manager.reindex_table("income")
+    assert manager.add_income(IncomeEntry(date="2025-01-07", source="Bonus", amount=50.0)) == 2
+
+
+def test_reindex_rejects_unknown_table(manager):
+    with pytest.raises(ValueError):
+        manager.reindex_table("sqlite_master")
+
+
+def test_monthly_totals_exclude_next_month(manager):
+    manager.add_income(IncomeEntry(date="2025-01-31", source="Salary", amount=5000.0))
+    manager.add_income(IncomeEntry(date="2025-02-01", source="Salary", amount=5000.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-10", category="Food", amount=40.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-20", category="Food", amount=60.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-21", category="Housing", amount=1500.0))
+    manager.add_expense(ExpenseEntry(date="2025-02-01", category="Food", amount=99.0))
+
+    assert manager.get_total_income_by_month(2025, 1) == 5000.0
+    assert manager.get_total_expenses_by_month(2025, 1) == 1600.0
+    assert manager.get_expenses_by_category_and_month("Food", 2025, 1) == 100.0
+    assert manager.get_category_summary(2025, 1) == {"Food": 100.0, "Housing": 1500.0}
+    assert manager.get_total_expenses_by_month(2024, 12) == 0
+
+
+def test_get_budget_status(manager):
+    manager.set_budget_limit(BudgetLimit(category="Food", monthly_limit=200.0))
+    manager.set_budget_limit(BudgetLimit(category="Housing", monthly_limit=1000.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-10", category="Food", amount=50.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-11", category="Housing", amount=1500.0))
+    manager.add_expense(ExpenseEntry(date="2025-02-01", category="Food", amount=500.0))
+
+    food, housing = manager.get_budget_status(2025, 1)
+    assert food == BudgetStatusRow(
+        category="Food",
+        limit=200.0,
+        spent=50.0,
+        remaining=150.0,
+        is_over_budget=False,
+        percentage_used=25.0,
+    )
+    assert housing.category == "Housing"
+    assert housing.is_over_budget is True
+    assert manager.get_budget_status(2024, 12)[0].spent == 0
+
+
+def test_in_memory_database():
+    budget_manager = BudgetManager(db_path=":memory:")
+    try:
+        budget_manager.add_income(IncomeEntry(date="2025-01-05", source="Salary", amount=5000.0))
+        assert budget_manager.get_total_income_by_month(2025, 1) == 5000.0
+    finally:
+        budget_manager.close()
+
+
+def test_search_entries_ignores_case(manager):
+    manager.add_income(IncomeEntry(date="2025-01-05", source="Salary", amount=5000.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-06", category="Food", amount=20.0, description="GROCERIES"))
+    manager.add_expense(ExpenseEntry(date="2025-01-07", category="Housing", amount=1500.0))
+
+    matching_income, matching_expenses = manager.search_entries("sALARY")
+    assert [income.source for income in matching_income] == ["Salary"]
+    assert matching_expenses == []
+
+    matching_income, matching_expenses = manager.search_entries("groceries", exclude=True)
+    assert [income.source for income in matching_income] == ["Salary"]
+    assert [expense.category for expense in matching_expenses] == ["Housing"]
+
+    results = manager.iter_search_entries("o", batch_size=1)
+    assert [(kind, entry.date) for kind, entry in results] == [
+        ("expenses", "2025-01-07"),
+        ("expenses", "2025-01-06"),
+    ]
+
+
+def test_loaded_rows_match_constructor(manager):
+    # NULL descriptions and empty aliases are normalized by the queries themselves
+    manager._conn.execute(
+        "INSERT INTO expenses (id, date, category, amount, description, alias) VALUES (7, '2025-01-06', 'Food', 12.5, NULL, '')"
+    )
+    manager._conn.execute(
+        "INSERT INTO budget_limits (id, category, monthly_limit, description) VALUES (1, 'Food', 200.0, NULL)"
+    )
+    assert manager.get_all_expenses() == [ExpenseEntry(
+        id=7, date="2025-01-06", category="Food", amount=12.5, description="", alias=None
+    )]
+    assert manager.get_budget_limit("Food") == BudgetLimit(
+        id=1, category="Food", monthly_limit=200.0
+    )
+
+
+def test_iter_expenses_by_date_range(manager):
+    for day in range(1, 8):
+        manager.add_expense(ExpenseEntry(date=f"2025-01-{day:02d}", category="Food", amount=float(day)))
+
+    expenses = manager.iter_expenses_by_date_range("2025-01-02", "2025-01-06", batch_size=2)
+    assert [expense.amount for expense in expenses] == [2.0, 3.0, 4.0, 5.0, 6.0]
+    assert sum(income.amount for income in manager.iter_income_by_date_range("2025-01-01", "2025-01-31")) == 0
+
+
+def test_budget_status_zero_limit(manager):
+    manager.set_budget_limit(BudgetLimit(category="Misc", monthly_limit=0.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-10", category="Misc", amount=10.0))
+
+    [status] = manager.get_budget_status(2025, 1)
+    assert status.percentage_used == 0
+    assert status.is_over_budget is True
+    assert status.remaining == -10.0
+
+
+def test_month_bounds():
+    assert _month_bounds(1970, 1) == (0, 31)
+    assert _month_bounds(2025, 12) == (20423, 20454)
+    assert _month_bounds(2025, 12) is _month_bounds(2025, 12)
+
+
+def test_entries_are_frozen_and_slotted():
+    income = IncomeEntry(date="2025-01-05", source="Salary", amount=100.0)
+    assert not hasattr(income, "__dict__")
+    with pytest.raises(AttributeError):
+        income.amount = 200.0
+
+
+def test_same_day_entries_keep_insertion_order(manager):
+    for source in ["Salary", "Bonus", "Gift"]:
+        manager.add_income(IncomeEntry(date="2025-01-05", source=source, amount=1.0))
+    manager.add_income(IncomeEntry(date="2025-01-01", source="Interest", amount=1.0))
+
+    assert [income.source for income in manager.get_all_income()] == ["Interest", "Salary", "Bonus", "Gift"]
+    plan = manager._conn.execute("EXPLAIN QUERY PLAN SELECT * FROM income ORDER BY date ASC").fetchall()
+    assert not any("TEMP B-TREE" in row[-1] for row in plan)
+
+
+def test_summaries_are_invalidated_by_writes(manager):
+    manager.set_budget_limit(BudgetLimit(category="Food", monthly_limit=100.0))
+    manager.add_income(IncomeEntry(date="2025-01-05", source="Salary", amount=1000.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-06", category="Food", amount=40.0))
+
+    assert manager.get_monthly_summary(2025, 1)["total_expenses"] == 40.0
+    assert manager.get_budget_status(2025, 1)[0].spent == 40.0
+    assert manager.get_category_summary(2025, 1) == {"Food": 40.0}
+
+    expense_id = manager.add_expense(ExpenseEntry(date="2025-01-07", category="Food", amount=80.0))
+    assert manager.get_monthly_summary(2025, 1)["total_expenses"] == 120.0
+    assert manager.get_budget_status(2025, 1)[0].is_over_budget is True
+    assert manager.get_category_summary(2025, 1) == {"Food": 120.0}
+
+    manager.delete_expense(expense_id)
+    manager.set_budget_limit(BudgetLimit(category="Food", monthly_limit=30.0))
+    assert manager.get_budget_status(2025, 1)[0].limit == 30.0
+    assert manager.get_monthly_summary(2025, 1)["total_expenses"] == 40.0
+
+
+def test_cached_summary_is_not_shared(manager):
+    manager.add_expense(ExpenseEntry(date="2025-01-06", category="Food", amount=40.0))
+    manager.get_category_summary(2025, 1)["Food"] = 0
+    assert manager.get_category_summary(2025, 1) == {"Food": 40.0}
+
+
+def test_get_category_breakdown(manager):
+    assert manager.get_category_breakdown(2025, 1) == ({}, 0.0)
+
+    manager.add_expenses_bulk([
+        ExpenseEntry(date="2025-01-06", category="Food", amount=40.0),
+        ExpenseEntry(date="2025-01-07", category="Housing", amount=1500.0),
+        ExpenseEntry(date="2025-01-08", category="Food", amount=60.0),
+        ExpenseEntry(date="2025-02-01", category="Food", amount=999.0),
+    ])
+    by_category, total = manager.get_category_breakdown(2025, 1)
+    assert list(by_category.items()) == [("Housing", 1500.0), ("Food", 100.0)]
+    assert total == 1600.0
+    assert by_category == manager.get_category_summary(2025, 1)
+
+
+def test_add_expenses_bulk(manager):
+    added = manager.add_expenses_bulk([
+        ExpenseEntry(date="2025-01-02", category="Food", amount=20.0),
+        ExpenseEntry(date="2025-01-03", category="Transport", amount=15.0),
+    ])
+    assert added == 2
+    assert manager.get_total_expenses_by_month(2025, 1) == 35.0
+
+
+def test_date_int_column_is_added_to_existing_database(tmp_path):
+    db_path = tmp_path / "old.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE "expenses" (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                category TEXT NOT NULL,
+                amount REAL NOT NULL,
+                description TEXT DEFAULT '',
+                alias TEXT DEFAULT '',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("INSERT INTO expenses (date, category, amount) VALUES ('2025-03-31', 'Food', 12.0)")
+    conn.close()
+
+    budget_manager = BudgetManager(db_path=str(db_path))
+    try:
+        assert budget_manager.get_total_expenses_by_month(2025, 3) == 12.0
+        assert [expense.amount for expense in budget_manager.get_expenses_by_date_range("2025-03-31", "2025-03-31")] == [12.0]
+    finally:
+        budget_manager.close()
+
+
+def test_read_errors_are_logged(manager, caplog):
+    manager._conn.execute("DROP TABLE budget_limits")
+    with caplog.at_level("ERROR"):
+        assert manager.get_budget_limit("Food") is None
+    assert "Database error" in caplog.text
+
+
+def test_get_overspending_alerts(manager):
+    manager.set_budget_limit(BudgetLimit(category="Food", monthly_limit=100.0))
+    manager.set_budget_limit(BudgetLimit(category="Housing", monthly_limit=1000.0))
+    manager.set_budget_limit(BudgetLimit(category="Fun", monthly_limit=50.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-10", category="Food", amount=150.0))
+    manager.add_expense(ExpenseEntry(date="2025-01-11", category="Housing", amount=900.0))
+
+    assert manager.get_overspending_alerts(2025, 1) == [{
+        'category': "Food",
+        'limit': 100.0,
+        'spent': 150.0,
+        'overspent': 50.0,
+        'percentage_over': 50.0,
+    }]
+    assert manager.get_overspending_alerts(2025, 2) == []
+
+
+def test_vacuum_and_analyze(manager):
+    manager.add_expense(ExpenseEntry(date="2025-01-10", category="Food", amount=15.0))
+    manager.vacuum_and_analyze()
+    assert manager._conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone()
+    assert manager.get_total_expenses_by_month(2025, 1) == 15.0
+
+
+def test_expense_arrays_and_monthly_totals(manager):
+    manager.add_expenses_bulk([
+        ExpenseEntry(date="2024-12-31", category="Food", amount=5.0),
+        ExpenseEntry(date="2025-01-02", category="Food", amount=20.0),
+        ExpenseEntry(date="2025-01-31", category="Rent", amount=30.0),
+        ExpenseEntry(date="2025-03-01", category="Food", amount=7.0),
+    ])
+
+    dates, amounts, categories = manager.get_expenses_arrays("2025-01-01", "2025-03-31")
+    assert amounts.tolist() == [20.0, 30.0, 7.0]
+    assert categories.tolist() == ["Food", "Rent", "Food"]
+    assert monthly_totals(dates, amounts, 2025, 1, 3).tolist() == [50.0, 0.0, 7.0]
+    assert monthly_totals(dates, amounts, 2024, 12, 2).tolist() == [0.0, 50.0]
+
+    dates, amounts, sources = manager.get_income_arrays("2025-01-01", "2025-03-31")
+    assert len(dates) == 0
+    assert monthly_totals(dates, amounts, 2025, 1, 2).tolist() == [0.0, 0.0]
+
+
+def test_set_budget_limits_bulk(manager):
+    written = manager.set_budget_limits_bulk([
+        BudgetLimit(category="Food", monthly_limit=200.0),
+        BudgetLimit(category="Rent", monthly_limit=1000.0),
+        BudgetLimit(category="Food", monthly_limit=250.0),
+    ])
+    assert written == 3
+    assert {limit.category: limit.monthly_limit for limit in manager.get_all_budget_limits()} == {
+        "Food": 250.0,
+        "Rent": 1000.0,
+    }
+
+
+def test_bulk_load_is_all_or_nothing(manager):
+    counts = manager.bulk_load(
+        [IncomeEntry(date="2024-01-01", source="Salary", amount=100.0)],
+        [ExpenseEntry(date="2024-01-02", category="Food", amount=10.0)],
+        [BudgetLimit(category="Food", monthly_limit=50.0)],
+    )
+    assert counts == (1, 1, 1)
+
+    with pytest.raises(ValueError):
+        manager.bulk_load(
+            [IncomeEntry(date="2024-02-01", source="Salary", amount=100.0)],
+            [ExpenseEntry(date="2024-02-02", category="Food", amount=10.0)],
+            # Violates the NOT NULL constraint on category once the earlier inserts ran
+            [BudgetLimit.from_row_unchecked((None, None, 50.0, ""))],
+        )
+    assert len(manager.get_all_income()) == 1
+    assert len(manager.get_all_expenses()) == 1
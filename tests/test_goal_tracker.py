@@ -0,0 +1,245 @@
+import dataclasses
+import sqlite3
+from datetime import date, timedelta
+
+import pytest
+from src.better_budget_tracker.goal_tracker import GoalTracker, SavingsGoal, _parse_target_date
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    goal_tracker = GoalTracker(db_path=str(tmp_path / "data" / "budget_data.db"))
+    yield goal_tracker
+    goal_tracker.close()
+
+
+def make_goal(name, target_amount=1000.0, current_amount=0.0, target_date="2099-12-31",
+              category="General", is_completed=False):
+    return SavingsGoal(
+        name=name,
+        target_amount=target_amount,
+        current_amount=current_amount,
+        target_date=target_date,
+        category=category,
+        is_completed=is_completed,
+        created_date="2025-01-01",
+    )
+
+
+def test_add_goals_bulk(tracker):
+    added = tracker.add_goals_bulk([make_goal("Emergency Fund"), make_goal("Vacation", target_date="2099-06-30")])
+    assert added == 2
+    assert [goal.name for goal in tracker.get_all_goals()] == ["Vacation", "Emergency Fund"]
+
+
+def test_goals_summary_uses_passed_goals(tracker):
+    tracker.add_goals_bulk([
+        make_goal("Emergency Fund", target_amount=1000.0, current_amount=250.0),
+        make_goal("Laptop", target_amount=500.0, current_amount=500.0, is_completed=True),
+        make_goal("Old Trip", target_amount=300.0, target_date="2000-01-01"),
+    ])
+    all_goals = tracker.get_all_goals()
+
+    summary = tracker.get_goals_summary(all_goals)
+    assert summary['total_goals'] == 3
+    assert summary['active_goals'] == 2
+    assert summary['completed_goals'] == 1
+    assert summary['overdue_goals'] == 1
+    assert summary['total_remaining'] == 1050.0
+    assert summary == tracker.get_goals_summary()
+    assert tracker.get_goals_summary([])['total_goals'] == 0
+    assert [goal.name for goal in tracker.get_goals_due_soon(30, all_goals)] == ["Old Trip"]
+
+
+def test_get_category_summary(tracker):
+    tracker.add_goals_bulk([
+        make_goal("Emergency Fund", target_amount=1000.0, current_amount=250.0, category="Safety"),
+        make_goal("Insurance", target_amount=500.0, current_amount=500.0, category="Safety", is_completed=True),
+        make_goal("Trip", target_amount=300.0, current_amount=30.0, category="Travel"),
+    ])
+
+    category_summary = tracker.get_category_summary()
+    assert category_summary["Safety"] == {
+        'total_goals': 2,
+        'active_goals': 1,
+        'completed_goals': 1,
+        'total_target': 1500.0,
+        'total_current': 750.0,
+        'total_remaining': 750.0,
+        'progress_percentage': 50.0,
+    }
+    assert category_summary["Travel"]["total_remaining"] == 270.0
+
+
+def test_goal_indexes_exist(tracker):
+    with sqlite3.connect(tracker.db_path) as conn:
+        index_names = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'savings_goals'"
+        )}
+    assert {"idx_goals_category", "idx_goals_completed", "idx_goals_target_date"} <= index_names
+
+
+def test_goal_connection_is_reused(tracker):
+    connection = tracker._conn
+    goal_id = tracker.add_goal(make_goal("Emergency Fund"))
+    assert tracker.add_progress(goal_id, 100.0)
+    assert tracker.get_goal_by_id(goal_id).current_amount == 100.0
+    assert tracker._conn is connection
+    assert tracker._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_goal_date_properties():
+    target = date.today() + timedelta(days=10)
+    goal = make_goal("Trip", target_date=target.isoformat())
+    assert goal.days_remaining == 10
+    assert not goal.is_overdue
+    assert make_goal("Old Trip", target_date="2000-01-01").is_overdue
+    assert not make_goal("Done", target_date="2000-01-01", current_amount=1000.0, is_completed=True).is_overdue
+    assert goal == make_goal("Trip", target_date=target.isoformat())
+    assert goal.target_date_obj == target
+    assert goal.days_remaining_on(target - timedelta(days=3)) == 3
+    assert goal.is_overdue_on(target + timedelta(days=1))
+    assert not goal.is_overdue_on(target)
+
+
+def test_date_properties_follow_target_date_reassignment(tracker):
+    goal = make_goal("Old Trip", target_date="2000-01-01")
+    assert goal.is_overdue
+    goal.target_date = "2099-01-01"
+    assert not goal.is_overdue
+    assert goal.days_remaining > 0
+    assert goal.target_date_obj == date(2099, 1, 1)
+
+    tracker.add_goal(make_goal("Loaded Trip", target_date="2000-01-01"))
+    loaded = tracker.get_all_goals()[0]
+    loaded.target_date = "2099-01-01"
+    assert not loaded.is_overdue_on(date(2050, 1, 1))
+
+
+def test_target_date_is_parsed_once_per_string():
+    goal = make_goal("Trip", target_date="2099-02-03")
+    goal.days_remaining
+    hits = _parse_target_date.cache_info().hits
+    assert goal.is_overdue_on(date(2099, 2, 4))
+    assert goal.target_date_obj == date(2099, 2, 3)
+    assert _parse_target_date.cache_info().hits == hits + 2
+
+
+def test_invalid_stored_target_date_does_not_raise(tracker):
+    tracker._conn.execute(
+        "INSERT INTO savings_goals (name, target_amount, target_date, category, created_date) "
+        "VALUES ('Broken', 100.0, 'not-a-date', 'Misc', '2025-01-01')"
+    )
+    goal = tracker.get_all_goals()[0]
+    assert goal.target_date_obj is None
+    assert goal.days_remaining == 0
+    assert not goal.is_overdue
+
+
+def test_load_arrays(tracker):
+    assert len(tracker.load_arrays()['ids']) == 0
+
+    tracker.add_goals_bulk([
+        make_goal("Emergency Fund", target_amount=1000.0, current_amount=250.0, target_date="2099-12-31"),
+        make_goal("Laptop", target_amount=500.0, current_amount=500.0, target_date="2099-01-31", is_completed=True),
+    ])
+    goal_arrays = tracker.load_arrays()
+    assert goal_arrays['names'].tolist() == ["Laptop", "Emergency Fund"]
+    assert goal_arrays['target_amounts'].sum() == 1500.0
+    assert goal_arrays['is_completed'].tolist() == [True, False]
+    assert str(goal_arrays['target_dates'][0]) == "2099-01-31"
+
+
+def test_add_progress_bulk(tracker):
+    tracker.add_goals_bulk([
+        make_goal("Emergency Fund", target_amount=1000.0, current_amount=250.0),
+        make_goal("Laptop", target_amount=500.0, current_amount=450.0),
+        make_goal("Trip", target_amount=300.0),
+    ])
+    goal_ids = {goal.name: goal.id for goal in tracker.get_all_goals()}
+
+    updated = tracker.add_progress_bulk({goal_ids["Emergency Fund"]: 100.0, goal_ids["Laptop"]: 80.0})
+    assert updated == 2
+    goals = {goal.name: goal for goal in tracker.get_all_goals()}
+    assert goals["Emergency Fund"].current_amount == 350.0
+    assert not goals["Emergency Fund"].is_completed
+    assert goals["Laptop"].current_amount == 500.0
+    assert goals["Laptop"].is_completed
+    assert goals["Trip"].current_amount == 0.0
+
+
+def test_add_progress_rejects_missing_goal(tracker):
+    goal_id = tracker.add_goal(make_goal("Trip", target_amount=300.0))
+    with pytest.raises(ValueError):
+        tracker.add_progress_bulk({goal_id: 10.0, goal_id + 1: 10.0})
+    assert tracker.get_goal_by_id(goal_id).current_amount == 0.0
+    with pytest.raises(ValueError):
+        tracker.add_progress(goal_id, 0)
+
+
+def test_get_goals_progress_trend(tracker):
+    goal_id = tracker.add_goal(make_goal("Trip", target_amount=1000.0, current_amount=500.0))
+
+    trend = tracker.get_goals_progress_trend(goal_id, months=12)
+    assert len(trend) == 12
+    assert trend[-1] == {'date': date.today().isoformat(), 'amount': 500.0, 'percentage': 50.0}
+    assert trend[0]['date'] == (date.today() - timedelta(days=330)).isoformat()
+    assert trend[0]['amount'] == 0
+    assert trend[-2]['amount'] == pytest.approx(450.0)
+    assert tracker.get_goals_progress_trend(goal_id + 1) == []
+
+
+def test_search_goals(tracker):
+    tracker.add_goals_bulk([
+        make_goal("Emergency Fund", category="Safety", target_date="2099-12-31"),
+        make_goal("Vacation", category="Travel", target_date="2099-06-30"),
+    ])
+    goal_id = tracker.add_goal(make_goal("Old Car", category="Vehicle"))
+
+    assert [goal.name for goal in tracker.search_goals("ERGEN")] == ["Emergency Fund"]
+    assert [goal.name for goal in tracker.search_goals("a")] == ["Vacation", "Emergency Fund", "Old Car"]
+    assert tracker.search_goals('say "hi"') == []
+
+    tracker.delete_goal(goal_id)
+    assert tracker.search_goals("Vehicle") == []
+
+
+def test_search_index_covers_existing_goals(tmp_path):
+    db_path = str(tmp_path / "data" / "budget_data.db")
+    goal_tracker = GoalTracker(db_path=db_path)
+    goal_tracker.add_goal(make_goal("Emergency Fund"))
+    goal_tracker._conn.execute("DROP TABLE goals_fts")
+    goal_tracker.close()
+
+    goal_tracker = GoalTracker(db_path=db_path)
+    try:
+        assert [goal.name for goal in goal_tracker.search_goals("mergency")] == ["Emergency Fund"]
+    finally:
+        goal_tracker.close()
+
+
+def test_from_row_unchecked_matches_constructor():
+    row = (3, "Trip", 300.0, 30.0, "2099-06-30", "Travel", None, 0, "2025-01-01", "2025-01-01 10:00:00")
+    goal = SavingsGoal.from_row_unchecked(row)
+    assert goal == SavingsGoal(id=3, name="Trip", target_amount=300.0, current_amount=30.0,
+                               target_date="2099-06-30", category="Travel", created_date="2025-01-01")
+    assert goal.days_remaining > 0
+    assert not hasattr(goal, "__dict__")
+    # Only persisted fields are stored; derived values are computed from them
+    assert SavingsGoal.__slots__ == tuple(field.name for field in dataclasses.fields(SavingsGoal))
+
+
+def test_date_filters_match_in_memory_filters(tracker):
+    today = date.today()
+    tracker.add_goals_bulk([
+        make_goal("Old Trip", target_date="2000-01-01"),
+        make_goal("Done", target_date="2000-01-01", is_completed=True),
+        make_goal("Soon", target_date=(today + timedelta(days=10)).isoformat()),
+        make_goal("Later", target_date=(today + timedelta(days=60)).isoformat()),
+    ])
+    all_goals = tracker.get_all_goals()
+
+    assert [goal.name for goal in tracker.get_overdue_goals()] == ["Old Trip"]
+    assert tracker.get_overdue_goals() == tracker.get_overdue_goals(all_goals)
+    assert [goal.name for goal in tracker.get_goals_due_soon(30)] == ["Old Trip", "Soon"]
+    assert tracker.get_goals_due_soon(30) == tracker.get_goals_due_soon(30, all_goals)
@@ -0,0 +1,160 @@
+import sys
+from io import StringIO
+
+import pytest
+from rich.console import Console
+from src.better_budget_tracker.main import BudgetTrackerCLI, SEARCH_EXPENSE_COLUMNS
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    # ConfigManager keeps its config, database and reports under the home directory
+    monkeypatch.setenv("HOME", str(tmp_path))
+    app = BudgetTrackerCLI()
+    app.console = Console(file=StringIO(), force_terminal=True, color_system=None, width=100)
+    app._is_tty = True
+    yield app
+    app.budget_manager.close()
+    app.goal_tracker.close()
+
+
+def feed_input(monkeypatch, *lines):
+    """Answer input() with the given lines, then behave like a closed stdin."""
+    answers = iter(lines)
+
+    def fake_input(prompt=""):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr("builtins.input", fake_input)
+
+
+def test_run_survives_failing_action_and_exits_on_eof(cli, monkeypatch):
+    def broken_action():
+        raise RuntimeError("boom")
+
+    cli._menu_dispatch["1"] = broken_action
+    feed_input(monkeypatch, "1", "1")
+    cli.run()
+
+    output = cli.console.file.getvalue()
+    assert output.count("Unexpected error: boom") == 2
+    assert "Exiting..." in output
+    assert not cli.running
+
+
+def test_run_reports_expected_errors(cli, monkeypatch):
+    def bad_input():
+        raise ValueError("bad amount")
+
+    cli._menu_dispatch["1"] = bad_input
+    feed_input(monkeypatch, "1", "8")
+    cli.run()
+
+    output = cli.console.file.getvalue()
+    assert "Error: bad amount" in output
+    assert "Thank you for using Budget Tracker!" in output
+
+
+def expense_rows(count):
+    return [(f"2025-01-{day % 28 + 1:02d}", "Food", f"${day:,.2f}", f"Lunch {day}") for day in range(count)]
+
+
+def test_print_table_short_results_use_rich_table(cli):
+    cli.print_table("bold red", SEARCH_EXPENSE_COLUMNS, expense_rows(3))
+
+    output = cli.console.file.getvalue()
+    assert "┃ Date" in output
+    assert "│ 2025-01-03 │ Food     │  $2.00 │ Lunch 2     │" in output
+
+
+@pytest.mark.parametrize("rich_tables, is_tty, count", [
+    (True, True, BudgetTrackerCLI.FAST_TABLE_THRESHOLD + 1),
+    (False, True, 3),
+    (True, False, 3),
+])
+def test_print_table_plain_path(cli, rich_tables, is_tty, count):
+    cli.rich_tables = rich_tables
+    cli._is_tty = is_tty
+    cli.print_table("bold red", SEARCH_EXPENSE_COLUMNS, expense_rows(count))
+
+    lines = cli.console.file.getvalue().splitlines()
+    assert "┃" not in lines[0]
+    assert lines[0].split() == ["Date", "Category", "Amount", "Description"]
+    assert len(lines) == count + 2
+    assert lines[3] == "2025-01-02  Food       $1.00  Lunch 1"
+    # Amounts are right-aligned, and a left-aligned last column is not padded
+    assert lines[2].index("$0.00") + len("$0.00") == lines[0].index("Amount") + len("Amount")
+    assert all(line == line.rstrip() for line in lines)
+
+
+class FakeTTY:
+    def isatty(self):
+        return True
+
+
+def test_print_paged_table(cli, monkeypatch):
+    monkeypatch.setattr(cli, "PAGE_SIZE", 2)
+    rows = expense_rows(5)
+    cli.print_paged_table("Expenses", "bold red", SEARCH_EXPENSE_COLUMNS, rows)
+
+    output = cli.console.file.getvalue()
+    assert output.count("Expenses") == 1
+    assert output.count("┃ Date") == 3
+    assert all(f"Lunch {day} " in output for day in range(5))
+
+
+def test_print_paged_table_stops_when_asked(cli, monkeypatch):
+    monkeypatch.setattr(cli, "PAGE_SIZE", 2)
+    monkeypatch.setattr(sys, "stdin", FakeTTY())
+    feed_input(monkeypatch, "q")
+    cli.print_paged_table("Expenses", "bold red", SEARCH_EXPENSE_COLUMNS, expense_rows(5))
+
+    output = cli.console.file.getvalue()
+    assert output.count("┃ Date") == 1
+    assert "Lunch 1 " in output
+    assert "Lunch 2 " not in output
+
+
+class CountingFile(StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_batched_output_writes_once(cli):
+    cli.console.file = out = CountingFile()
+    with cli._batched_output():
+        cli.console.print("[bold]first[/bold]")
+        cli.print_table("bold red", SEARCH_EXPENSE_COLUMNS, expense_rows(60))
+        assert out.getvalue() == ""
+
+    assert cli.console.file is out
+    assert out.writes == 1
+    output = out.getvalue()
+    assert output.startswith("first\n")
+    assert "Lunch 59" in output
+
+
+def test_spinner_shares_one_progress_and_restarts(cli):
+    progress = cli._progress
+    with cli._spinner("Generating first report..."):
+        assert progress.live.is_started
+        assert [task.description for task in progress.tasks] == ["Generating first report..."]
+    assert not progress.live.is_started
+
+    with pytest.raises(ValueError):
+        with cli._spinner("Generating second report..."):
+            assert [task.description for task in progress.tasks] == ["Generating second report..."]
+            raise ValueError("no data")
+
+    assert cli._progress is progress
+    assert not progress.live.is_started
+    assert progress.tasks == []
+    assert "Generating second report..." in cli.console.file.getvalue()
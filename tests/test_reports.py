@@ -0,0 +1,38 @@
+import csv
+
+import pytest
+from src.better_budget_tracker.budget import BudgetManager, ExpenseEntry
+from src.better_budget_tracker.goal_tracker import GoalTracker
+from src.better_budget_tracker.reports import ReportGenerator
+
+
+@pytest.fixture
+def generator(tmp_path):
+    db_path = str(tmp_path / "data" / "budget_data.db")
+    budget_manager = BudgetManager(db_path=db_path)
+    goal_tracker = GoalTracker(db_path=db_path)
+    yield ReportGenerator(budget_manager, goal_tracker, str(tmp_path / "reports"))
+    budget_manager.close()
+    goal_tracker.close()
+
+
+def read_csv(filename):
+    with open(filename, encoding="utf-8", newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_export_expenses_csv(generator):
+    generator.budget_manager.add_expenses_bulk([
+        ExpenseEntry(date="2025-01-05", category="Food", amount=12.5, description='Lunch, "the usual"'),
+        ExpenseEntry(date="2025-01-20", category="Housing, rent", amount=1500.0, description="Rent\nJanuary"),
+        ExpenseEntry(date="2025-02-01", category="Food", amount=3.0),
+    ])
+
+    header = ["id", "date", "category", "amount", "description"]
+    january = [
+        ["1", "2025-01-05", "Food", "12.50", 'Lunch, "the usual"'],
+        ["2", "2025-01-20", "Housing, rent", "1500.00", "Rent\nJanuary"],
+    ]
+    assert read_csv(generator.export_expenses_csv()) == [header, *january, ["3", "2025-02-01", "Food", "3.00", ""]]
+    assert read_csv(generator.export_expenses_csv(2025, 1)) == [header, *january]
+    assert read_csv(generator.export_expenses_csv(2024, 12)) == [header]
@@ -5,6 +5,7 @@ from src.better_budget_tracker.utils import (
     format_currency,
     validate_date,
     format_date,
+    validate_category,
 )
 
 
@@ -72,6 +73,10 @@ def test_validate_date_date_string_date_invalid():
     assert validate_date("2025-13-30") is False
 
 
+def test_validate_date_date_string_compact_iso_invalid():
+    assert validate_date("20251030") is False
+
+
 def test_format_date_date_string_valid_default_formats():
     assert format_date("2025-10-30") == "October 30, 2025"
 
@@ -80,6 +85,12 @@ def test_format_date_date_string_valid_alternate_formats():
     assert format_date("30-10-2025", "%d-%m-%Y", "%Y-%m-%d") == "2025-10-30"
 
 
+def test_format_date_date_string_iso_passthrough():
+    assert format_date("2025-10-30", output_format="%Y-%m-%d") == "2025-10-30"
+    with pytest.raises(ValueError):
+        format_date("2025-13-30", output_format="%Y-%m-%d")
+
+
 def test_format_date_date_string_invalid_date_format():
     test_date_string = "2025-10-30"
     test_input_format = "%d-%m-%Y"
@@ -89,3 +100,15 @@ def test_format_date_date_string_invalid_date_format():
         f"Invalid date format: time data '{test_date_string}' does "
         f"not match format '{test_input_format}'"
     ) in str(e.value)
+
+
+def test_validate_category_valid():
+    assert validate_category("Food & Dining") is True
+
+
+def test_validate_category_invalid():
+    assert validate_category("") is False
+    assert validate_category("   ") is False
+    assert validate_category("Food, Dining") is False
+    assert validate_category("Food!") is False
+    assert validate_category("x" * 51) is False